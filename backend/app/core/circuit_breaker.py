@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised by callers that refuse to serve a degraded answer while the breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker that lets callers skip a degraded upstream.
+
+    After ``fail_max`` failures in a row the breaker opens and ``allow()`` returns
+    False until ``reset_timeout`` seconds pass; then trial calls are let through and
+    the next success closes it again.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0) -> None:
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            return time.monotonic() - self._opened_at >= self.reset_timeout
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
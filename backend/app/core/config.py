@@ -34,6 +34,8 @@ class Settings:
     api_token: str | None
     allow_live_trading: bool
     cors_origins: List[str]
+    supabase_fetch_workers: int
+    supabase_max_connections: int
 
 
 def _get_bool(name: str, default: bool = False) -> bool:
@@ -43,6 +45,16 @@ def _get_bool(name: str, default: bool = False) -> bool:
     return value.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _get_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
 def _get_list(name: str, default: List[str]) -> List[str]:
     value = os.getenv(name)
     if not value:
@@ -86,4 +98,8 @@ def get_settings() -> Settings:
                 "http://localhost:3000",
             ],
         ),
+        supabase_fetch_workers=_get_int("SUPABASE_FETCH_WORKERS", 8),
+        supabase_max_connections=_get_int(
+            "SUPABASE_MAX_CONNECTIONS", min(32, (os.cpu_count() or 1) * 2 + 4)
+        ),
     )
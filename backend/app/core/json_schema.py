@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+
+from jsonschema import Draft7Validator
+
+
+@lru_cache(maxsize=256)
+def _validator_for(schema_key: str) -> Draft7Validator:
+    return Draft7Validator(json.loads(schema_key))
+
+
+def get_validator(schema: dict) -> Draft7Validator:
+    """Return a Draft7Validator for schema, reusing one per distinct schema content."""
+    try:
+        schema_key = json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return Draft7Validator(schema)
+    return _validator_for(schema_key)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import threading
 import time
 from dataclasses import dataclass
 from typing import Any, Callable, Dict
@@ -12,27 +13,35 @@ class _CacheEntry:
 
 
 class TTLCache:
-    """Simple in-memory TTL cache for short-lived API responses."""
+    """Simple in-memory TTL cache for short-lived API responses.
+
+    Entries are kept in recency order, so when the cache is full and nothing has
+    expired the least recently used key is evicted first.
+    """
 
     def __init__(self, default_ttl: float = 10.0, maxsize: int = 256) -> None:
         self.default_ttl = default_ttl
         self.maxsize = maxsize
         self._store: Dict[str, _CacheEntry] = {}
+        self._lock = threading.RLock()
 
     def get(self, key: str) -> Any | None:
-        entry = self._store.get(key)
-        if entry is None:
-            return None
-        if entry.expires_at < time.monotonic():
-            self._store.pop(key, None)
-            return None
-        return entry.value
+        with self._lock:
+            entry = self._store.pop(key, None)
+            if entry is None:
+                return None
+            if entry.expires_at < time.monotonic():
+                return None
+            self._store[key] = entry
+            return entry.value
 
     def set(self, key: str, value: Any, ttl: float | None = None) -> None:
-        if len(self._store) >= self.maxsize:
-            self._prune()
         expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
-        self._store[key] = _CacheEntry(value=value, expires_at=expires_at)
+        with self._lock:
+            self._store.pop(key, None)
+            if len(self._store) >= self.maxsize:
+                self._prune()
+            self._store[key] = _CacheEntry(value=value, expires_at=expires_at)
 
     def get_or_set(self, key: str, loader: Callable[[], Any], ttl: float | None = None) -> Any:
         cached = self.get(key)
@@ -42,6 +51,14 @@ class TTLCache:
         self.set(key, value, ttl=ttl)
         return value
 
+    def pop(self, key: str) -> None:
+        with self._lock:
+            self._store.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
     def _prune(self) -> None:
         now = time.monotonic()
         expired_keys = [key for key, entry in self._store.items() if entry.expires_at < now]
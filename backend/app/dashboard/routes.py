@@ -277,8 +277,10 @@ def _normalize_positions(
 
 
 
+# Plain def: every repository/Alpaca call below is blocking, so FastAPI runs this in its
+# threadpool instead of stalling the event loop.
 @router.get("/dashboard", response_model=DashboardResponse)
-async def get_dashboard(
+def get_dashboard(
     range: RangeLiteral = Query(default="1M", description="Time range"),
     user_id: str | None = Query(default=None),
     x_user_id: str | None = Header(default=None, alias="X-User-Id"),
@@ -556,6 +558,7 @@ async def get_dashboard(
                 environment,
                 history_curve,
                 cash=cash,
+                prune=range == "ALL",
             )
             logger.info(
                 "dashboard.performance_from_alpaca env=%s range=%s points=%s",
@@ -572,9 +575,7 @@ async def get_dashboard(
         )
 
     # ✅ equity_curve: Alpaca history 우선, 없으면 snapshots fallback
-    equity_curve_raw = history_curve or portfolio_repo.list_equity_curve(
-        resolved_user_id, environment, _range_days(range)
-    ) or []
+    equity_curve_raw = history_curve or []
 
     def _pick_time_key(row: dict) -> str | None:
         # 흔히 나오는 key들을 모두 허용
@@ -599,6 +600,15 @@ async def get_dashboard(
         if equity_val is None:
             equity_val = row.get("value") or row.get("equity_value")
         equity_curve.append({"t": str(t), "equity": float(equity_val or 0)})
+    if not history_curve:
+        # snapshots는 (t, equity) 배열로 받아서 키 정규화 없이 바로 {t, equity}로 묶는다
+        snapshot_dates, snapshot_equity = portfolio_repo.list_equity_curve_arrays(
+            resolved_user_id, environment, _range_days(range)
+        )
+        equity_curve = [
+            {"t": str(t), "equity": e}
+            for t, e in zip(snapshot_dates.tolist(), snapshot_equity.tolist())
+        ]
     equity_curve = _sanitize_equity_curve(equity_curve)
 
     if not equity_curve and equity > 0:
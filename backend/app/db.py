@@ -20,12 +20,25 @@ def _get_dsn() -> str:
     return dsn
 
 
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    # Decode numeric columns straight to float at the driver level instead of Decimal.
+    await conn.set_type_codec(
+        "numeric",
+        encoder=str,
+        decoder=float,
+        schema="pg_catalog",
+        format="text",
+    )
+
+
 async def init_db() -> None:
     global _pool
     if _pool is not None:
         return
     dsn = _get_dsn()
-    _pool = await asyncpg.create_pool(dsn=dsn, min_size=1, max_size=10)
+    _pool = await asyncpg.create_pool(
+        dsn=dsn, min_size=1, max_size=10, init=_init_connection
+    )
 
 
 async def close_db() -> None:
@@ -4,8 +4,10 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Literal, Optional
 
+import numpy as np
 import pandas as pd
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 
 from app.alpaca.client import AlpacaAccount, AlpacaClient
 from app.core.config import get_settings
@@ -19,7 +21,7 @@ from app.core.alpaca_cache import (
     get_positions_cached as _get_positions_cached,
 )
 from app.core.time import now_kst
-from app.services.backtest_runner import build_price_frame, resolve_universe
+from app.services.backtest_runner import build_price_matrix, resolve_universe, stack_price_matrix
 from engine.backtest.metrics import compute_drawdown, compute_metrics, compute_returns
 from app.services.data_provider import load_price_series
 from app.strategies.base import StrategyContext
@@ -814,8 +816,6 @@ def _compute_live_strategy_targets(
     if benchmark_symbol:
         symbols.add(benchmark_symbol)
 
-    price_series = {}
-    prices_df = build_price_frame({})
     price_matrix = pd.DataFrame()
     period_start = None
     for multiplier in (2.5, 5.0):
@@ -828,16 +828,12 @@ def _compute_live_strategy_targets(
             period_end,
             "adj_close",
         )
-        prices_df = build_price_frame(price_series)
-        if prices_df.empty:
+        price_matrix = build_price_matrix(price_series)
+        if price_matrix.empty:
             continue
-        price_matrix = prices_df.reset_index().pivot(
-            index="date", columns="symbol", values="adj_close"
-        )
-        price_matrix = price_matrix.sort_index()
         if len(price_matrix.index) >= lookback + 1:
             break
-    if prices_df.empty or price_matrix.empty:
+    if price_matrix.empty:
         raise APIError(
             "DATA_NOT_FOUND",
             f"No market prices for strategy {strategy_id}",
@@ -845,6 +841,7 @@ def _compute_live_strategy_targets(
             status_code=404,
         )
 
+    prices_df = stack_price_matrix(price_matrix)
     dt = price_matrix.index[-1]
     available_symbols = list(price_matrix.columns)
     logger.info(
@@ -931,14 +928,15 @@ def _compute_live_strategy_targets(
         )
         return {}, {}
 
-    latest_prices = price_matrix.loc[dt].to_dict()
+    # dt is the last row; read it positionally instead of building a Series via .loc.
+    latest_prices = price_matrix.to_numpy(dtype=np.float64, na_value=np.nan)[-1]
+    col_to_i = {symbol: i for i, symbol in enumerate(price_matrix.columns)}
     price_map: Dict[str, float] = {}
     for symbol in weights.keys():
-        price = latest_prices.get(symbol)
-        try:
-            price_val = float(price)
-        except (TypeError, ValueError):
+        j = col_to_i.get(symbol)
+        if j is None:
             continue
+        price_val = float(latest_prices[j])
         if price_val > 0:
             price_map[symbol] = price_val
 
@@ -1005,6 +1003,7 @@ async def get_portfolio_overview(
 @router.get(
     "/portfolio/performance",
     response_model=PortfolioPerformanceResponse,
+    response_class=ORJSONResponse,
     summary="Portfolio performance time series",
 )
 async def get_portfolio_performance(
@@ -1032,19 +1031,22 @@ async def get_portfolio_performance(
         )
 
     equity_curve = _history_to_equity_points(history)
-    return {
-        "env": env,
-        "range": range,
-        "benchmark": benchmark,
-        "as_of": now_kst().isoformat(),
-        "equity_curve": equity_curve,
-        "benchmark_curve": [],
-    }
+    return ORJSONResponse(
+        {
+            "env": env,
+            "range": range,
+            "benchmark": benchmark,
+            "as_of": now_kst().isoformat(),
+            "equity_curve": equity_curve,
+            "benchmark_curve": [],
+        }
+    )
 
 
 @router.get(
     "/portfolio/drawdown",
     response_model=PortfolioDrawdownResponse,
+    response_class=ORJSONResponse,
     summary="Portfolio drawdown",
 )
 async def get_portfolio_drawdown(
@@ -1073,15 +1075,17 @@ async def get_portfolio_drawdown(
     current_dd = drawdown_curve[-1]["drawdown_pct"] if drawdown_curve else 0.0
     max_dd = min((d["drawdown_pct"] for d in drawdown_curve), default=0.0)
 
-    return {
-        "env": env,
-        "range": range,
-        "drawdown_curve": drawdown_curve,
-        "summary": {
-            "current_drawdown_pct": round(current_dd, 2),
-            "max_drawdown_pct": round(max_dd, 2),
-        },
-    }
+    return ORJSONResponse(
+        {
+            "env": env,
+            "range": range,
+            "drawdown_curve": drawdown_curve,
+            "summary": {
+                "current_drawdown_pct": round(current_dd, 2),
+                "max_drawdown_pct": round(max_dd, 2),
+            },
+        }
+    )
 
 
 @router.get(
@@ -1413,6 +1417,7 @@ async def set_kill_switch(
 @router.get(
     "/portfolio/rebalance-targets",
     response_model=PortfolioRebalanceTargetsResponse,
+    response_class=ORJSONResponse,
     summary="Latest saved rebalance targets",
 )
 async def get_rebalance_targets(
@@ -1432,7 +1437,7 @@ async def get_rebalance_targets(
         for row in rows
         if row.get("strategy_id")
     ]
-    return {"env": env, "items": items}
+    return ORJSONResponse({"env": env, "items": items})
 
 
 @router.post(
@@ -1940,6 +1945,7 @@ async def rebalance_portfolio(
 @router.get(
     "/portfolio/activity",
     response_model=PortfolioActivityResponse,
+    response_class=ORJSONResponse,
     summary="Portfolio activity feed",
 )
 async def get_portfolio_activity(
@@ -2051,4 +2057,4 @@ async def get_portfolio_activity(
         last = items[-1]
         next_cursor = f"{last['t']}|{last['id']}"
 
-    return {"env": env, "items": items, "next_cursor": next_cursor}
+    return ORJSONResponse({"env": env, "items": items, "next_cursor": next_cursor})
@@ -13,7 +13,8 @@ import re
 import websockets
 from websockets.exceptions import ConnectionClosed
 
-from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, Query, Response, WebSocket, WebSocketDisconnect
+from fastapi.responses import ORJSONResponse
 
 from app.alpaca.client import AlpacaClient
 from app.core.config import get_settings
@@ -31,7 +32,7 @@ from app.schemas.trading import (
 from app.services.data_provider import load_price_series
 from app.services.trading_service import (
     fetch_order_by_id,
-    fetch_orders,
+    fetch_orders_json,
     fetch_positions,
     fetch_last_fill,
 )
@@ -884,14 +885,15 @@ async def list_orders(
         user_id=resolved_user_id,
         sync_orders=True,
     )
-    items = await fetch_orders(
+    # The payload is encoded by orjson in the service and bypasses response_model re-validation.
+    payload = await fetch_orders_json(
         conn,
         user_id=resolved_user_id,
         environment=env,
         scope=scope,
         limit=limit,
     )
-    return {"items": items}
+    return Response(content=payload, media_type="application/json")
 
 
 @router.get("/orders/{order_id}", response_model=OrderDetailResponse)
@@ -1074,7 +1076,7 @@ async def get_quote(
     }
 
 
-@router.get("/bars", response_model=BarsResponse)
+@router.get("/bars", response_model=BarsResponse, response_class=ORJSONResponse)
 async def get_bars(
     symbol: str,
     timeframe: str = Query(default="1Min"),
@@ -1228,12 +1230,14 @@ async def get_bars(
         len(items),
     )
 
-    return {
-        "symbol": symbol,
-        "timeframe": timeframe,
-        "feed": data_feed,
-        "bars": items,
-    }
+    return ORJSONResponse(
+        {
+            "symbol": symbol,
+            "timeframe": timeframe,
+            "feed": data_feed,
+            "bars": items,
+        }
+    )
 
 
 @router.websocket("/stream")
@@ -4,18 +4,13 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.schemas.dashboard import PnlBlock
+
 
 EnvLiteral = Literal["paper", "live"]
 RangeLiteral = Literal["1W", "1M", "3M", "1Y", "ALL"]
 
 
-class PnlBlock(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-
-    value: float
-    pct: float
-
-
 class ModeBlock(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -4,12 +4,7 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
-
-class ErrorDetail(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-
-    field: str
-    reason: str
+from app.schemas.backtests import ErrorDetail
 
 
 class PaginationResponse(BaseModel):
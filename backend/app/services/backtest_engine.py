@@ -7,12 +7,13 @@ from app.services.data_provider import load_price_series
 from engine.backtest.ensemble import (
     EnsembleStrategyContext,
     SimulationProgressCallback,
+    build_price_table,
     run_ensemble,
     run_single,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyContext:
     strategy_id: str
     params: Dict[str, Any]
@@ -32,13 +33,13 @@ def run_single_backtest(
         spec["period_end"],
         spec.get("price_field", "adj_close"),
     )
-    dates = list(next(iter(prices.values())).keys()) if prices else []
+    table = build_price_table(prices)
     engine_ctx = EnsembleStrategyContext(
         strategy_id=strategy_ctx.strategy_id,
         params=strategy_ctx.params,
         label=strategy_ctx.label,
     )
-    return run_single(prices, dates, spec, engine_ctx, benchmark_curve, progress_cb)
+    return run_single(table, spec, engine_ctx, benchmark_curve, progress_cb)
 
 
 def run_ensemble_backtest(
@@ -55,7 +56,7 @@ def run_ensemble_backtest(
         spec["period_end"],
         spec.get("price_field", "adj_close"),
     )
-    dates = list(next(iter(prices.values())).keys()) if prices else []
+    table = build_price_table(prices)
     engine_ctxs = [
         EnsembleStrategyContext(
             strategy_id=ctx.strategy_id,
@@ -64,4 +65,4 @@ def run_ensemble_backtest(
         )
         for ctx in strategies
     ]
-    return run_ensemble(prices, dates, spec, engine_ctxs, ensemble, benchmark_curve, progress_cb)
+    return run_ensemble(table, spec, engine_ctxs, ensemble, benchmark_curve, progress_cb)
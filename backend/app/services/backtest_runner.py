@@ -3,10 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Dict, List
 
+import numpy as np
 import pandas as pd
-from jsonschema import Draft7Validator
 
 from app.core.errors import APIError
+from app.core.json_schema import get_validator
 from app.services.data_provider import load_price_series
 from app.strategies.sandbox import PYTHON_ENTRYPOINT, PYTHON_META_KEY, extract_python_body
 from app.strategies.registry import get_strategy
@@ -46,7 +47,7 @@ def resolve_universe(params: Dict, benchmark_symbol: str | None) -> List[str]:
 def validate_params(param_schema: Dict, params: Dict) -> None:
     if not param_schema:
         return
-    validator = Draft7Validator(param_schema)
+    validator = get_validator(param_schema)
     errors = []
     for error in validator.iter_errors(params):
         field = ".".join([str(p) for p in error.path])
@@ -55,17 +56,40 @@ def validate_params(param_schema: Dict, params: Dict) -> None:
         raise APIError("VALIDATION_ERROR", "Invalid params", details=errors, status_code=422)
 
 
-def build_price_frame(price_series: Dict[str, Dict[str, float]]) -> pd.DataFrame:
-    rows = []
-    for symbol, series in price_series.items():
-        for date, price in series.items():
-            rows.append({"date": date, "symbol": symbol, "adj_close": price})
-    if not rows:
+def build_price_matrix(price_series: Dict[str, Dict[str, float]]) -> pd.DataFrame:
+    """{symbol: {date: price}} → wide 가격 행렬 (index=date, columns=symbol).
+
+    입력이 이미 심볼별 컬럼 형태이므로 셀 단위 레코드를 만들지 않고
+    하나의 float64 (날짜 × 심볼) 버퍼에 열 단위로 값을 채운 뒤 복사 없이 DataFrame으로 감싼다.
+    날짜 문자열은 합집합을 정렬한 뒤 한 번만 파싱한다.
+    """
+    date_keys = sorted({d for series in price_series.values() for d in series})
+    row_of = {d: i for i, d in enumerate(date_keys)}
+    symbols = sorted(price_series)
+    values = np.full((len(date_keys), len(symbols)), np.nan, dtype=np.float64)
+    for j, symbol in enumerate(symbols):
+        series = price_series[symbol]
+        if not series:
+            continue
+        rows = np.fromiter((row_of[d] for d in series), dtype=np.intp, count=len(series))
+        values[rows, j] = np.fromiter(
+            (np.nan if v is None else v for v in series.values()), dtype=np.float64, count=len(series)
+        )
+    index = pd.DatetimeIndex(pd.to_datetime(date_keys, format="%Y-%m-%d"), name="date")
+    columns = pd.Index(symbols, name="symbol")
+    return pd.DataFrame(values, index=index, columns=columns, copy=False)
+
+
+def stack_price_matrix(price_matrix: pd.DataFrame) -> pd.DataFrame:
+    """wide 가격 행렬 → 전략이 기대하는 MultiIndex(date, symbol) + adj_close 형식."""
+    if price_matrix.empty:
         return pd.DataFrame(columns=["date", "symbol", "adj_close"]).set_index(["date", "symbol"])
-    df = pd.DataFrame(rows)
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.set_index(["date", "symbol"]).sort_index()
-    return df
+    return (
+        price_matrix.stack()
+        .dropna()
+        .to_frame("adj_close")
+        .rename_axis(["date", "symbol"])
+    )
 
 
 class _DataProviderAdapter:
@@ -78,10 +102,7 @@ class _DataProviderAdapter:
         series_dict = load_price_series(tickers, start, end, self._price_field)
         if not series_dict:
             return pd.DataFrame()
-        df = pd.DataFrame(series_dict)
-        df.index = pd.to_datetime(df.index)
-        df.index.name = "date"
-        return df.sort_index()
+        return build_price_matrix(series_dict)
 
 
 def run_backtest(
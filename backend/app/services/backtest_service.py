@@ -4,12 +4,13 @@ import base64
 import uuid
 from typing import Any, Dict, List
 
+import numpy as np
 from fastapi import BackgroundTasks
-from jsonschema import Draft7Validator
 
 from app.benchmarks.data import BENCHMARKS
 from app.core.config import Settings
 from app.core.errors import APIError
+from app.core.json_schema import get_validator
 from app.core.time import now_kst, parse_datetime
 from app.schemas.backtests import (
     BacktestCreateRequest,
@@ -128,7 +129,7 @@ def _job_is_canceled(backtest_id: str) -> bool:
 
 
 def _validate_json_schema(schema: dict, params: dict, field_prefix: str) -> List[Dict[str, str]]:
-    validator = Draft7Validator(schema)
+    validator = get_validator(schema)
     errors: List[Dict[str, str]] = []
     for error in validator.iter_errors(params):
         path = ".".join([str(p) for p in error.path])
@@ -228,16 +229,15 @@ def _build_benchmark_curve(ref: Dict[str, Any], spec: dict) -> List[Dict[str, fl
     series = prices.get(symbol, {})
     if not series:
         return []
-    equity = initial_cash
-    curve = []
-    prev_price = None
-    for date in sorted(series.keys()):
-        price = series.get(date)
-        if prev_price is not None and price:
-            equity *= price / prev_price
-        curve.append({"date": date, "equity": equity})
-        prev_price = price
-    return curve
+    dates = sorted(series.keys())
+    prices = np.array([series[d] or 0.0 for d in dates], dtype=np.float64)
+    # Seed the cumulative product with the entry cash so the multiplication order matches a running loop.
+    factors = np.ones(len(dates), dtype=np.float64)
+    factors[0] = initial_cash
+    prev, curr = prices[:-1], prices[1:]
+    np.divide(curr, prev, out=factors[1:], where=(curr != 0) & (prev != 0))
+    equity = np.cumprod(factors)
+    return [{"date": d, "equity": e} for d, e in zip(dates, equity.tolist())]
 
 
 def _build_benchmarks_payload(benchmarks: List[Dict[str, Any]], spec: dict) -> Dict[str, Any]:
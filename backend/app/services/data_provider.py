@@ -1,25 +1,31 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 import time
 from typing import Dict, List
 
+import numpy as np
+
 from app.core.config import get_settings
+from app.core.ttl_cache import TTLCache
 from app.storage.supabase_client import get_supabase_client
 
 
+PRICE_CACHE_TTL = 300.0
+
+PRICE_CACHE = TTLCache(default_ttl=PRICE_CACHE_TTL, maxsize=64)
+
+
 def parse_date(value: str) -> date:
     return datetime.strptime(value, "%Y-%m-%d").date()
 
 
 def trading_days(start: date, end: date) -> List[date]:
-    days = []
-    current = start
-    while current <= end:
-        if current.weekday() < 5:
-            days.append(current)
-        current += timedelta(days=1)
-    return days
+    if end < start:
+        return []
+    days = np.arange(np.datetime64(start, "D"), np.datetime64(end, "D") + 1)
+    return days[np.is_busday(days)].tolist()
 
 
 def _base_price(ticker: str) -> float:
@@ -35,12 +41,27 @@ def load_price_series(
 ) -> Dict[str, Dict[str, float]]:
     settings = get_settings()
     supabase = get_supabase_client(settings)
-    if supabase is not None:
-        return _load_from_supabase(
-            supabase, tickers, period_start, period_end, price_field
+    if supabase is None:
+        return _load_mock_prices(tickers, period_start, period_end)
+
+    # Repeated backtests over the same universe and period reuse the fetched series.
+    key = f"prices:{price_field}:{period_start}:{period_end}:{','.join(sorted(set(tickers)))}"
+    cached = PRICE_CACHE.get(key)
+    if cached is None:
+        cached = _load_from_supabase(
+            supabase, tickers, period_start, period_end, price_field,
+            max_workers=settings.supabase_fetch_workers,
         )
+        if any(cached.values()):
+            PRICE_CACHE.set(key, cached)
+    return {ticker: dict(cached.get(ticker, {})) for ticker in tickers}
+
 
-    return _load_mock_prices(tickers, period_start, period_end)
+def _mock_price_matrix(bases: np.ndarray, n_days: int) -> np.ndarray:
+    i = np.arange(n_days, dtype=np.float64)
+    drift = 1 + 0.0008 * i
+    seasonal = 0.01 * ((np.arange(n_days) % 10) - 5) / 10
+    return bases[:, None] * drift[None, :] * (1 + seasonal)[None, :]
 
 
 def _load_mock_prices(
@@ -49,17 +70,14 @@ def _load_mock_prices(
     start = parse_date(period_start)
     end = parse_date(period_end)
     days = trading_days(start, end)
+    iso_days = [d.isoformat() for d in days]
+
+    bases = np.array([_base_price(ticker) for ticker in tickers], dtype=np.float64)
+    prices = np.round(_mock_price_matrix(bases, len(days)), 4)
 
     series: Dict[str, Dict[str, float]] = {}
-    for ticker in tickers:
-        base = _base_price(ticker)
-        ticker_series: Dict[str, float] = {}
-        for i, d in enumerate(days):
-            drift = 1 + 0.0008 * i
-            seasonal = 0.01 * ((i % 10) - 5) / 10
-            price = base * drift * (1 + seasonal)
-            ticker_series[d.isoformat()] = round(price, 4)
-        series[ticker] = ticker_series
+    for ticker, row in zip(tickers, prices.tolist()):
+        series[ticker] = dict(zip(iso_days, row))
     return series
 
 
@@ -69,6 +87,7 @@ def _load_from_supabase(
     period_start: str,
     period_end: str,
     price_field: str,
+    max_workers: int = 8,
 ) -> Dict[str, Dict[str, float]]:
     field = price_field if price_field in {"adj_close", "close"} else "adj_close"
     result: Dict[str, Dict[str, float]] = {}
@@ -86,21 +105,11 @@ def _load_from_supabase(
             raise last_exc
         raise RuntimeError("Supabase query failed")
 
-    for ticker in tickers:
-        def _base_query():
-            return (
-                supabase.table("market_prices")
-                .select(f"price_date,{field}")
-                .gte("price_date", period_start)
-                .lte("price_date", period_end)
-                .order("price_date", desc=False)
-            )
+    page_size = 1000
 
-        query = _base_query().eq("symbol", ticker)
-
-        rows = []
+    def _fetch_all(query) -> List[dict]:
+        rows: List[dict] = []
         from_index = 0
-        page_size = 1000
         while True:
             page = _execute_with_retry(query.range(from_index, from_index + page_size - 1))
             data = getattr(page, "data", None) or []
@@ -108,21 +117,17 @@ def _load_from_supabase(
             if len(data) < page_size:
                 break
             from_index += page_size
+        return rows
+
+    def _base_query(columns: str):
+        return (
+            supabase.table("market_prices")
+            .select(columns)
+            .gte("price_date", period_start)
+            .lte("price_date", period_end)
+        )
 
-        if not rows:
-            try:
-                query_alt = _base_query().ilike("symbol", ticker)
-                from_index = 0
-                while True:
-                    page = _execute_with_retry(query_alt.range(from_index, from_index + page_size - 1))
-                    data = getattr(page, "data", None) or []
-                    rows.extend(data)
-                    if len(data) < page_size:
-                        break
-                    from_index += page_size
-            except Exception:
-                rows = []
-
+    def _bucket(rows: List[dict]) -> Dict[str, float]:
         series: Dict[str, float] = {}
         for row in rows:
             date_str = row.get("price_date")
@@ -130,6 +135,43 @@ def _load_from_supabase(
             if date_str is None or value is None:
                 continue
             series[str(date_str)] = float(value)
-        result[ticker] = series
+        return series
+
+    # One IN query for the whole universe instead of one paginated query per ticker.
+    grouped: Dict[str, List[dict]] = {ticker: [] for ticker in tickers}
+    if tickers:
+        query = (
+            _base_query(f"symbol,price_date,{field}")
+            .in_("symbol", list(dict.fromkeys(tickers)))
+            .order("symbol", desc=False)
+            .order("price_date", desc=False)
+        )
+        for row in _fetch_all(query):
+            bucket = grouped.get(row.get("symbol"))
+            if bucket is not None:
+                bucket.append(row)
+
+    def _fetch_case_insensitive(ticker: str) -> List[dict]:
+        try:
+            return _fetch_all(
+                _base_query(f"price_date,{field}")
+                .ilike("symbol", ticker)
+                .order("price_date", desc=False)
+            )
+        except Exception:
+            return []
+
+    # Symbols stored with different casing are not matched by IN; retry those
+    # case-insensitively, overlapping the per-ticker round-trips in a thread pool.
+    unmatched = [ticker for ticker in dict.fromkeys(tickers) if not grouped[ticker]]
+    if len(unmatched) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unmatched))) as pool:
+            grouped.update(zip(unmatched, pool.map(_fetch_case_insensitive, unmatched)))
+    else:
+        for ticker in unmatched:
+            grouped[ticker] = _fetch_case_insensitive(ticker)
+
+    for ticker in tickers:
+        result[ticker] = _bucket(grouped[ticker])
 
     return result
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import base64
+import json
 import uuid
 from typing import Any
 
+from app.core.circuit_breaker import CircuitOpenError
 from app.core.config import Settings
 from app.core.errors import APIError
+from app.core.json_schema import get_validator
 from app.schemas.strategies_v1 import (
     AddPublicStrategyRequest,
     CloneMyStrategyRequest,
@@ -24,7 +27,6 @@ from app.strategies.sandbox import (
     hash_code,
     validate_python_strategy,
 )
-from jsonschema import Draft7Validator
 
 _DEFAULT_SAMPLE_METRICS = {"pnl_amount": 0.0, "pnl_pct": 0.0, "sharpe": 0.0, "max_drawdown_pct": 0.0, "win_rate_pct": 0.0}
 _DEFAULT_SAMPLE_TRADE_STATS = {"trades_count": 0.0, "avg_hold_hours": 0.0}
@@ -47,8 +49,19 @@ def _decode_cursor(cursor: str | None) -> str | None:
         return None
 
 
+def _split_cursor(raw: str | None) -> tuple[str | None, str | None]:
+    # Cursors are JSON [sort_value, public_strategy_id]; older cursors carry the sort value only.
+    if not raw:
+        return None, None
+    try:
+        value, cursor_id = json.loads(raw)
+        return str(value), str(cursor_id)
+    except (ValueError, TypeError):
+        return raw, None
+
+
 def _validate_params(param_schema: dict, params: dict) -> list[dict[str, str]]:
-    validator = Draft7Validator(param_schema)
+    validator = get_validator(param_schema)
     errors = []
     for error in validator.iter_errors(params):
         field = ".".join([str(p) for p in error.path])
@@ -125,10 +138,15 @@ class StrategyService:
             raise APIError("VALIDATION_ERROR", "Invalid sort", status_code=400)
         if order not in {"asc", "desc"}:
             raise APIError("VALIDATION_ERROR", "Invalid order", status_code=400)
-        data = self._public_repo.list({"q": q, "tag": tag, "category": category, "risk_level": risk_level}, sort, order, limit + 1, _decode_cursor(cursor))
+        cursor_value, cursor_id = _split_cursor(_decode_cursor(cursor))
+        try:
+            data = self._public_repo.list({"q": q, "tag": tag, "category": category, "risk_level": risk_level}, sort, order, limit + 1, cursor_value, cursor_id=cursor_id)
+        except CircuitOpenError as exc:
+            raise APIError("SUPABASE_UNAVAILABLE", "Public strategies are temporarily unavailable", str(exc), status_code=503) from exc
         next_cursor = None
         if len(data) > limit:
-            next_cursor = _encode_cursor(str(data[limit - 1].get(sort)))
+            last = data[limit - 1]
+            next_cursor = _encode_cursor(json.dumps([str(last.get(sort)), str(last.get("public_strategy_id"))]))
             data = data[:limit]
         return {"items": [_format_public_strategy(row) for row in data], "next_cursor": next_cursor}
 
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Any, Dict, List
 
 import asyncpg
+import orjson
 
 from app.core.config import Settings
 from app.core.errors import APIError
@@ -44,67 +45,29 @@ def _to_iso(value: Any) -> str | None:
 
 
 def _to_float(value: Any) -> float:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
+    # Pool connections decode numeric to float (see app.db); only NULL needs handling.
+    if value is None:
         return 0.0
+    return float(value)
 
 
-def _order_row_to_dict(row: asyncpg.Record) -> Dict[str, Any]:
-    strategy_id = row.get("strategy_id")
-    strategy_name = row.get("strategy_name")
+def _strategy_ref(strategy_id: Any, strategy_name: Any) -> Dict[str, str] | None:
+    if not strategy_id:
+        return None
     return {
-        "order_id": row["order_id"],
-        "submitted_at": _to_iso(row.get("submitted_at")),
-        "symbol": row.get("symbol"),
-        "side": row.get("side"),
-        "type": row.get("type"),
-        "qty": _to_float(row.get("qty")),
-        "status": row.get("status"),
-        "filled_at": _to_iso(row.get("filled_at")),
-        "strategy_id": strategy_id,
-        "strategy": (
-            {
-                "id": str(strategy_id),
-                "name": str(strategy_name) if strategy_name else str(strategy_id),
-            }
-            if strategy_id
-            else None
-        ),
+        "id": str(strategy_id),
+        "name": str(strategy_name) if strategy_name else str(strategy_id),
     }
 
 
-def _position_row_to_dict(row: asyncpg.Record) -> Dict[str, Any]:
-    return {
-        "symbol": row.get("symbol"),
-        "qty": _to_float(row.get("qty")),
-        "avg_price": _to_float(row.get("avg_entry_price")),
-        "unrealized_pnl": _to_float(row.get("unrealized_pnl")),
-        "strategy_id": row.get("strategy_id"),
-        "updated_at": _to_iso(row.get("updated_at")),
-    }
+# status_norm is a stored generated column; the open scope matches a partial index.
+_OPEN_WHERE = (
+    "AND o.status_norm NOT IN "
+    "('filled','canceled','cancelled','rejected','expired')"
+)
+_FILLED_WHERE = "AND o.status_norm = 'filled'"
 
-
-async def fetch_orders(
-    conn: asyncpg.Connection,
-    *,
-    user_id: str,
-    environment: str,
-    scope: str,
-    limit: int,
-) -> List[Dict[str, Any]]:
-    where = ""
-    params = [user_id, environment, limit]
-    status_norm = r"regexp_replace(lower(trim(coalesce(o.status, ''))), '^.*\.', '')"
-    if scope == "open":
-        where = (
-            f"AND {status_norm} NOT IN "
-            "('filled','canceled','cancelled','rejected','expired')"
-        )
-    elif scope == "filled":
-        where = f"AND {status_norm} = 'filled'"
-
-    query = f"""
+_ORDERS_QUERY_TEMPLATE = """
         SELECT
           o.order_id, o.submitted_at, o.symbol, o.side, o.type, o.qty, o.status, o.filled_at, o.strategy_id,
           us.name AS strategy_name
@@ -118,8 +81,98 @@ async def fetch_orders(
         ORDER BY o.submitted_at DESC NULLS LAST
         LIMIT $3
     """
-    rows = await conn.fetch(query, *params)
-    return [_order_row_to_dict(row) for row in rows]
+
+# Built once so asyncpg's statement cache sees one stable text per scope.
+_ORDERS_QUERY_BY_SCOPE: Dict[str, str] = {
+    "open": _ORDERS_QUERY_TEMPLATE.format(where=_OPEN_WHERE),
+    "filled": _ORDERS_QUERY_TEMPLATE.format(where=_FILLED_WHERE),
+    "all": _ORDERS_QUERY_TEMPLATE.format(where=""),
+}
+
+
+def _order_row_to_dict(
+    row: asyncpg.Record,
+    strategy_cache: Dict[tuple, Dict[str, str] | None] | None = None,
+) -> Dict[str, Any]:
+    # Positional unpack; the column order matches the SELECT in fetch_orders/fetch_order_by_id.
+    (
+        order_id,
+        submitted_at,
+        symbol,
+        side,
+        type_,
+        qty,
+        status,
+        filled_at,
+        strategy_id,
+        strategy_name,
+    ) = row
+    if strategy_cache is None:
+        strategy = _strategy_ref(strategy_id, strategy_name)
+    else:
+        # Orders from the same strategy share one read-only strategy ref.
+        key = (strategy_id, strategy_name)
+        if key not in strategy_cache:
+            strategy_cache[key] = _strategy_ref(strategy_id, strategy_name)
+        strategy = strategy_cache[key]
+    return {
+        "order_id": order_id,
+        "submitted_at": _to_iso(submitted_at),
+        "symbol": symbol,
+        "side": side,
+        "type": type_,
+        "qty": _to_float(qty),
+        "status": status,
+        "filled_at": _to_iso(filled_at),
+        "strategy_id": strategy_id,
+        "strategy": strategy,
+    }
+
+
+def _position_row_to_dict(row: asyncpg.Record) -> Dict[str, Any]:
+    # Positional unpack; the column order matches the SELECT in fetch_positions.
+    symbol, qty, avg_entry_price, unrealized_pnl, strategy_id, updated_at = row
+    return {
+        "symbol": symbol,
+        "qty": _to_float(qty),
+        "avg_price": _to_float(avg_entry_price),
+        "unrealized_pnl": _to_float(unrealized_pnl),
+        "strategy_id": strategy_id,
+        "updated_at": _to_iso(updated_at),
+    }
+
+
+async def fetch_orders(
+    conn: asyncpg.Connection,
+    *,
+    user_id: str,
+    environment: str,
+    scope: str,
+    limit: int,
+) -> List[Dict[str, Any]]:
+    query = _ORDERS_QUERY_BY_SCOPE.get(scope, _ORDERS_QUERY_BY_SCOPE["all"])
+    rows = await conn.fetch(query, user_id, environment, limit)
+    strategy_cache: Dict[tuple, Dict[str, str] | None] = {}
+    return [_order_row_to_dict(row, strategy_cache) for row in rows]
+
+
+async def fetch_orders_json(
+    conn: asyncpg.Connection,
+    *,
+    user_id: str,
+    environment: str,
+    scope: str,
+    limit: int,
+) -> bytes:
+    """Same as fetch_orders, pre-serialized as an {"items": [...]} JSON body."""
+    items = await fetch_orders(
+        conn,
+        user_id=user_id,
+        environment=environment,
+        scope=scope,
+        limit=limit,
+    )
+    return orjson.dumps({"items": items})
 
 
 async def fetch_order_by_id(
@@ -172,7 +225,7 @@ async def fetch_last_fill(
     symbol: str,
 ) -> Dict[str, Any] | None:
     query = """
-        SELECT fill_id, filled_at, symbol, side, qty, price
+        SELECT symbol, price, filled_at
         FROM trades
         WHERE user_id = $1
           AND symbol = $2
@@ -182,8 +235,9 @@ async def fetch_last_fill(
     row = await conn.fetchrow(query, user_id, symbol)
     if not row:
         return None
+    fill_symbol, price, filled_at = row
     return {
-        "symbol": row.get("symbol"),
-        "price": _to_float(row.get("price")),
-        "filled_at": _to_iso(row.get("filled_at")),
+        "symbol": fill_symbol,
+        "price": _to_float(price),
+        "filled_at": _to_iso(filled_at),
     }
@@ -3,8 +3,12 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 from app.core.config import Settings
+from app.core.ttl_cache import TTLCache
 from app.storage.supabase_client import get_supabase_client
 
+# Dashboard polls hit list_recent every few seconds; alerts rarely change in between.
+ALERTS_CACHE = TTLCache(default_ttl=2.0, maxsize=256)
+
 
 class AlertsRepository:
     def __init__(self, settings: Settings) -> None:
@@ -13,6 +17,10 @@ class AlertsRepository:
     def list_recent(self, user_id: str, limit: int = 5) -> List[Dict[str, Any]]:
         if self.supabase is None:
             return []
+        cache_key = f"{user_id}:{limit}"
+        cached = ALERTS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
         try:
             result = (
                 self.supabase.table("alerts")
@@ -24,6 +32,7 @@ class AlertsRepository:
             )
             data = getattr(result, "data", None)
             if data is not None:
+                ALERTS_CACHE.set(cache_key, data)
                 return data
         except Exception:
             return []
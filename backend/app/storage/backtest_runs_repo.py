@@ -4,21 +4,31 @@ from typing import Any, Dict, Optional
 
 from app.core.config import Settings
 from app.core.time import now_kst
+from app.core.ttl_cache import TTLCache
 from app.storage.supabase_client import get_supabase_client
 
+# Short-lived read cache for get(); create() evicts the row it writes.
+RUNS_CACHE = TTLCache(default_ttl=2.0, maxsize=256)
+
+
+def _cache_key(user_id: Any, run_id: Any) -> str:
+    return f"{user_id}:{run_id}"
+
 
 class BacktestRunsRepository:
     def __init__(self, settings: Settings) -> None:
         self.supabase = get_supabase_client(settings)
 
     def create(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        now = now_kst().isoformat()
         row = {
             **payload,
-            "created_at": now_kst().isoformat(),
-            "updated_at": now_kst().isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
         if self.supabase is None:
             return row
+        RUNS_CACHE.pop(_cache_key(row.get("user_id"), row.get("run_id")))
         result = self.supabase.table("backtest_runs").insert(row).execute()
         data = getattr(result, "data", None)
         if data:
@@ -28,6 +38,10 @@ class BacktestRunsRepository:
     def get(self, user_id: str, run_id: str) -> Optional[Dict[str, Any]]:
         if self.supabase is None:
             return None
+        cache_key = _cache_key(user_id, run_id)
+        cached = RUNS_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
         result = (
             self.supabase.table("backtest_runs")
             .select("*")
@@ -38,5 +52,6 @@ class BacktestRunsRepository:
         )
         data = getattr(result, "data", None)
         if data:
+            RUNS_CACHE.set(cache_key, data[0])
             return data[0]
         return None
@@ -3,20 +3,30 @@ from __future__ import annotations
 import threading
 from typing import Any, Dict, List, Optional
 
+_LOCK_SHARDS = 16
+
 
 class BacktestStore:
     def __init__(self) -> None:
-        self._lock = threading.Lock()
+        # Writers lock only the shard owning their backtest_id. Single-key reads and
+        # list snapshots rely on dict operations being atomic under the GIL.
+        self._locks = [threading.Lock() for _ in range(_LOCK_SHARDS)]
         self._jobs: Dict[str, Dict[str, Any]] = {}
         self._results: Dict[str, Dict[str, Any]] = {}
+        # user_id -> backtest ids in creation order (dict used as an ordered set)
+        self._jobs_by_user: Dict[str, Dict[str, None]] = {}
+
+    def _lock_for(self, backtest_id: str) -> threading.Lock:
+        return self._locks[hash(backtest_id) % _LOCK_SHARDS]
 
     def create_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
-        with self._lock:
+        with self._lock_for(job["backtest_id"]):
             self._jobs[job["backtest_id"]] = job
+            self._jobs_by_user.setdefault(job.get("user_id"), {})[job["backtest_id"]] = None
         return job
 
     def update_job(self, backtest_id: str, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        with self._lock:
+        with self._lock_for(backtest_id):
             job = self._jobs.get(backtest_id)
             if not job:
                 return None
@@ -25,36 +35,39 @@ class BacktestStore:
             return job
 
     def get_job(self, backtest_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            return self._jobs.get(backtest_id)
+        return self._jobs.get(backtest_id)
 
     def list_jobs(
         self, user_id: str, filters: Dict[str, Any], sort: str, order: str
     ) -> List[Dict[str, Any]]:
-        with self._lock:
-            items = [job for job in self._jobs.values() if job.get("user_id") == user_id]
+        ids = list(self._jobs_by_user.get(user_id, ()))
+        jobs = [self._jobs.get(backtest_id) for backtest_id in ids]
+        items = [job for job in jobs if job is not None]
 
         if filters.get("status"):
             items = [job for job in items if job.get("status") == filters["status"]]
         if filters.get("mode"):
             items = [job for job in items if job.get("mode") == filters["mode"]]
 
-        reverse = order == "desc"
-        items.sort(key=lambda j: j.get(sort, ""), reverse=reverse)
-        return items
+        # Sort keys are read once per job; None is ordered like a missing field.
+        keys = [job.get(sort) for job in items]
+        keys = ["" if key is None else key for key in keys]
+        ranked = sorted(range(len(items)), key=keys.__getitem__, reverse=order == "desc")
+        return [items[i] for i in ranked]
 
     def set_results(self, backtest_id: str, results: Dict[str, Any]) -> None:
-        with self._lock:
+        with self._lock_for(backtest_id):
             self._results[backtest_id] = results
 
     def get_results(self, backtest_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            return self._results.get(backtest_id)
+        return self._results.get(backtest_id)
 
     def delete(self, backtest_id: str) -> None:
-        with self._lock:
-            self._jobs.pop(backtest_id, None)
+        with self._lock_for(backtest_id):
+            job = self._jobs.pop(backtest_id, None)
             self._results.pop(backtest_id, None)
+            if job is not None:
+                self._jobs_by_user.get(job.get("user_id"), {}).pop(backtest_id, None)
 
 
 STORE = BacktestStore()
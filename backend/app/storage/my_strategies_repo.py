@@ -82,11 +82,12 @@ class MyStrategiesRepository:
         return None
 
     def create(self, user_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        now = now_kst().isoformat()
         row = {
             "user_id": user_id,
             **payload,
-            "created_at": now_kst().isoformat(),
-            "updated_at": now_kst().isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
         if self.supabase is None:
             return row
@@ -8,6 +8,9 @@ from app.storage.supabase_client import get_supabase_client
 
 logger = logging.getLogger("uvicorn.error")
 
+_DELETE_CHUNK_SIZE = 500
+_FINAL_STATUSES = frozenset({"filled", "canceled", "cancelled", "rejected", "expired"})
+
 
 class OrdersRepository:
     def __init__(self, settings: Settings) -> None:
@@ -73,7 +76,21 @@ class OrdersRepository:
     def delete_open_orders(self, user_id: str, environment: str, limit: int = 2000) -> int:
         if self.supabase is None:
             return 0
-        final_statuses = {"filled", "canceled", "cancelled", "rejected", "expired"}
+        try:
+            # status_norm is the generated normalized status column; the DB filters and
+            # deletes in a single statement.
+            result = (
+                self.supabase.table("orders")
+                .delete()
+                .eq("user_id", user_id)
+                .eq("environment", environment)
+                .not_.in_("status_norm", list(_FINAL_STATUSES))
+                .execute()
+            )
+            return len(getattr(result, "data", None) or [])
+        except Exception as exc:
+            logger.warning("orders.delete_open_orders fallback due to schema mismatch/error: %s", exc)
+        # Backward-compatible fallback for DBs without orders.status_norm.
         try:
             rows = self.list_recent(user_id, environment, limit=limit)
             open_ids: List[str] = []
@@ -84,16 +101,17 @@ class OrdersRepository:
                 status = str(row.get("status") or "").strip().lower()
                 if "." in status:
                     status = status.split(".")[-1]
-                if status in final_statuses:
+                if status in _FINAL_STATUSES:
                     continue
                 open_ids.append(str(order_id))
-            for order_id in open_ids:
+            # One DELETE ... WHERE order_id IN (...) per chunk instead of one request per order.
+            for start in range(0, len(open_ids), _DELETE_CHUNK_SIZE):
                 (
                     self.supabase.table("orders")
                     .delete()
                     .eq("user_id", user_id)
                     .eq("environment", environment)
-                    .eq("order_id", order_id)
+                    .in_("order_id", open_ids[start:start + _DELETE_CHUNK_SIZE])
                     .execute()
                 )
             return len(open_ids)
@@ -1,42 +1,113 @@
 from __future__ import annotations
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from app.core.config import Settings
 from app.core.time import now_kst
 from app.storage.supabase_client import get_supabase_client
 
+logger = logging.getLogger("uvicorn.error")
+
+
+# Rows per PostgREST write; keeps request bodies well under the default 1 MB limit.
+_SNAPSHOT_CHUNK_SIZE = 500
+
+
+# Ranges at least this long are served from the portfolio_equity_daily materialized view
+# (plus raw snapshots since its last rolled-up day).
+_DAILY_ROLLUP_MIN_DAYS = 30
+
+# Below this many points the builtin sort is cheaper than building a NumPy key array.
+_ARGSORT_MIN_POINTS = 64
+
+
+def _chunks(rows: List[Dict[str, Any]], size: int = _SNAPSHOT_CHUNK_SIZE) -> List[List[Dict[str, Any]]]:
+    return [rows[start:start + size] for start in range(0, len(rows), size)]
+
 
 class PortfolioRepository:
     def __init__(self, settings: Settings) -> None:
         self.supabase = get_supabase_client(settings)
+        self._max_workers = settings.supabase_fetch_workers
 
-    def list_equity_curve(
+    def _select_curve(
+        self, table: str, columns: str, time_col: str, user_id: str, environment: str, since: str
+    ) -> List[Dict[str, Any]]:
+        result = (
+            self.supabase.table(table)
+            .select(columns)
+            .eq("user_id", user_id)
+            .eq("environment", environment)
+            .gte(time_col, since)
+            .order(time_col, desc=False)
+            .execute()
+        )
+        return getattr(result, "data", None) or []
+
+    def _fetch_snapshot_rows(
+        self, user_id: str, environment: str, since: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Raw snapshot rows since ``since`` as {"t", "equity"}; None when no source could be read."""
+        # The view renames as_of -> t and casts equity to float8 server-side;
+        # the aliased table select covers DBs where the view has not been created yet.
+        sources = [
+            ("portfolio_equity_curve_v", "t,equity", "t"),
+            ("portfolio_snapshots", "t:as_of,equity::float8", "as_of"),
+        ]
+        for table, columns, time_col in sources:
+            try:
+                return self._select_curve(table, columns, time_col, user_id, environment, since)
+            except Exception:
+                continue
+        return None
+
+    def _fetch_equity_rows(
         self, user_id: str, environment: str, range_days: int
     ) -> List[Dict[str, Any]]:
+        """Snapshot rows in the window, already shaped as {"t", "equity"} by the database."""
         if self.supabase is None:
             return []
-        start = now_kst() - timedelta(days=range_days)
+        start = (now_kst() - timedelta(days=range_days)).isoformat()
+        if range_days >= _DAILY_ROLLUP_MIN_DAYS:
+            # Long ranges read the daily rollup (one row per KST day, t at KST midnight). The view
+            # only changes when it is refreshed (pg_cron, where installed), so its last day may be
+            # partial and later snapshots missing: drop that day and re-read raw snapshots from its start.
+            try:
+                daily = self._select_curve(
+                    "portfolio_equity_daily", "t,equity", "t", user_id, environment, start
+                )
+            except Exception:
+                daily = []
+            if daily:
+                tail = self._fetch_snapshot_rows(user_id, environment, str(daily[-1]["t"]))
+                if tail is None:
+                    return daily
+                return daily[:-1] + tail
+        return self._fetch_snapshot_rows(user_id, environment, start) or []
+
+    def list_equity_curve(
+        self, user_id: str, environment: str, range_days: int
+    ) -> List[Dict[str, Any]]:
+        return self._fetch_equity_rows(user_id, environment, range_days)
+
+    def list_equity_curve_arrays(
+        self, user_id: str, environment: str, range_days: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Same snapshots as list_equity_curve, as (dates, equity) arrays for the metrics pipeline."""
+        data = self._fetch_equity_rows(user_id, environment, range_days)
         try:
-            result = (
-                self.supabase.table("portfolio_snapshots")
-                .select("as_of,equity")
-                .eq("user_id", user_id)
-                .eq("environment", environment)
-                .gte("as_of", start.isoformat())
-                .order("as_of", desc=False)
-                .execute()
+            dates = np.array([item["t"] for item in data], dtype=object)
+            equity = np.fromiter(
+                (float(item["equity"]) for item in data), dtype=np.float64, count=len(data)
             )
-            data = getattr(result, "data", None)
-            if data is not None:
-                return [
-                    {"t": item["as_of"], "equity": float(item["equity"])}
-                    for item in data
-                ]
         except Exception:
-            return []
-        return []
+            return np.empty(0, dtype=object), np.empty(0, dtype=np.float64)
+        return dates, equity
 
     def replace_equity_curve_range(
         self,
@@ -45,16 +116,26 @@ class PortfolioRepository:
         points: List[Dict[str, Any]],
         *,
         cash: float,
+        prune: bool = False,
     ) -> None:
-        """Replace snapshot rows in the incoming time window with fresh Alpaca history points."""
+        """Upsert snapshot rows for the incoming Alpaca history points.
+
+        With ``prune`` (full-range refreshes) the window is replaced by the
+        replace_equity_curve RPC, deleting rows that are not in ``points`` in the same
+        transaction; otherwise rows are upserted. Payloads above _SNAPSHOT_CHUNK_SIZE rows
+        are written in concurrent chunks (a pruned one after a single range delete).
+        """
         if self.supabase is None or not points:
             return
-        sorted_points = sorted(
-            [p for p in points if p.get("t") is not None],
-            key=lambda p: str(p["t"]),
-        )
-        if not sorted_points:
+        valid_points = [p for p in points if p.get("t") is not None]
+        if not valid_points:
             return
+        if len(valid_points) < _ARGSORT_MIN_POINTS:
+            sorted_points = sorted(valid_points, key=lambda p: str(p["t"]))
+        else:
+            # Same string ordering as sorted(), but the comparisons run inside NumPy's stable sort.
+            keys = np.array([str(p["t"]) for p in valid_points])
+            sorted_points = [valid_points[i] for i in np.argsort(keys, kind="stable").tolist()]
         start = str(sorted_points[0]["t"])
         end = str(sorted_points[-1]["t"])
         rows = []
@@ -69,15 +150,52 @@ class PortfolioRepository:
                 }
             )
         try:
-            (
-                self.supabase.table("portfolio_snapshots")
-                .delete()
-                .eq("user_id", user_id)
-                .eq("environment", environment)
-                .gte("as_of", start)
-                .lte("as_of", end)
-                .execute()
+            if prune and len(rows) <= _SNAPSHOT_CHUNK_SIZE:
+                self.supabase.rpc(
+                    "replace_equity_curve",
+                    {"p_user": user_id, "p_env": environment, "p_rows": rows},
+                ).execute()
+                return
+            if prune:
+                self._delete_range(user_id, environment, start, end)
+            self._write_chunks(
+                rows,
+                lambda chunk: self.supabase.table("portfolio_snapshots")
+                .upsert(chunk, on_conflict="user_id,environment,as_of")
+                .execute(),
+            )
+            return
+        except Exception as exc:
+            logger.warning(
+                "portfolio.replace_equity_curve_range fallback due to schema mismatch/error: %s", exc
+            )
+        # Backward-compatible fallback for DBs without the unique index or the RPC.
+        try:
+            self._delete_range(user_id, environment, start, end)
+            self._write_chunks(
+                rows,
+                lambda chunk: self.supabase.table("portfolio_snapshots").insert(chunk).execute(),
             )
-            self.supabase.table("portfolio_snapshots").insert(rows).execute()
         except Exception:
             return
+
+    def _write_chunks(self, rows: List[Dict[str, Any]], write: Callable[[List[Dict[str, Any]]], Any]) -> None:
+        chunks = _chunks(rows)
+        if len(chunks) > 1 and self._max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(chunks))) as pool:
+                # list() drains the iterator so a failed chunk raises here.
+                list(pool.map(write, chunks))
+        else:
+            for chunk in chunks:
+                write(chunk)
+
+    def _delete_range(self, user_id: str, environment: str, start: str, end: str) -> None:
+        (
+            self.supabase.table("portfolio_snapshots")
+            .delete()
+            .eq("user_id", user_id)
+            .eq("environment", environment)
+            .gte("as_of", start)
+            .lte("as_of", end)
+            .execute()
+        )
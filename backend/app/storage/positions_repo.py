@@ -6,6 +6,14 @@ from app.core.config import Settings
 from app.storage.supabase_client import get_supabase_client
 
 
+# Sorts backed by a positions column; value/pnl_pct are derived, so callers order those in memory.
+_SORT_COLUMNS: Dict[str, str] = {
+    "symbol": "symbol",
+    "pnl": "unrealized_pnl",
+}
+_ALLOWED_ORDERS = frozenset({"asc", "desc"})
+
+
 class PositionsRepository:
     def __init__(self, settings: Settings) -> None:
         self.supabase = get_supabase_client(settings)
@@ -45,7 +53,31 @@ class PositionsRepository:
     ) -> List[Dict[str, Any]]:
         if self.supabase is None:
             return []
+        # Unknown or derived sort keys and bad orders are dropped (unordered) rather than forwarded to the DB.
+        sort_col = _SORT_COLUMNS.get(sort) if sort and order in _ALLOWED_ORDERS else None
+
+        # One round trip: filters, whitelisted sort and limit are applied by the RPC.
+        try:
+            result = self.supabase.rpc(
+                "list_positions",
+                {
+                    "p_user_id": user_id,
+                    "p_env": environment,
+                    "p_q": q or None,
+                    "p_side": side or None,
+                    "p_strategy_id": strategy_id or None,
+                    "p_sort": sort_col or None,
+                    "p_order_desc": order == "desc",
+                    "p_limit": limit,
+                },
+            ).execute()
+            data = getattr(result, "data", None)
+            if data is not None:
+                return data
+        except Exception:
+            pass
 
+        # Fallback for DBs without the RPC.
         def _build_query(use_alt_strategy_id: bool = False):
             query = (
                 self.supabase.table("positions")
@@ -60,15 +92,8 @@ class PositionsRepository:
             if strategy_id:
                 col = "user_strategy_id" if use_alt_strategy_id else "strategy_id"
                 query = query.eq(col, strategy_id)
-            if sort:
-                sort_col = {
-                    "symbol": "symbol",
-                    "value": "market_value",
-                    "pnl": "unrealized_pnl",
-                    "pnl_pct": "unrealized_pnl_pct",
-                }.get(sort, sort)
-                if sort_col:
-                    query = query.order(sort_col, desc=(order == "desc"))
+            if sort_col:
+                query = query.order(sort_col, desc=(order == "desc"))
             return query.limit(limit)
 
         try:
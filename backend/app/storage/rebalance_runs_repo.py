@@ -12,10 +12,11 @@ class RebalanceRunsRepository:
         self.supabase = get_supabase_client(settings)
 
     def create(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        now = now_kst().isoformat()
         row = {
             **payload,
-            "created_at": payload.get("created_at") or now_kst().isoformat(),
-            "updated_at": payload.get("updated_at") or now_kst().isoformat(),
+            "created_at": payload.get("created_at") or now,
+            "updated_at": payload.get("updated_at") or now,
         }
         if self.supabase is None:
             return row
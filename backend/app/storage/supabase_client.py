@@ -1,17 +1,36 @@
 from __future__ import annotations
 
+import threading
 from typing import Optional
 
+import httpx
+
 from app.core.config import Settings
 
 try:
-    from supabase import Client, create_client
+    from supabase import Client, ClientOptions, create_client
 except Exception:  # pragma: no cover - optional dependency
     Client = None
+    ClientOptions = None
     create_client = None
 
 
 _supabase_client: Optional["Client"] = None
+_supabase_client_lock = threading.Lock()
+
+
+def _build_http_client(settings: Settings) -> httpx.Client:
+    # One bounded keep-alive HTTP/2 pool shared by every repository in the process.
+    return httpx.Client(
+        http2=True,
+        follow_redirects=True,
+        timeout=120,
+        limits=httpx.Limits(
+            max_connections=settings.supabase_max_connections,
+            max_keepalive_connections=min(16, settings.supabase_max_connections),
+            keepalive_expiry=30,
+        ),
+    )
 
 
 def get_supabase_client(settings: Settings) -> Optional["Client"]:
@@ -22,7 +41,11 @@ def get_supabase_client(settings: Settings) -> Optional["Client"]:
         return None
     if create_client is None:
         return None
-    _supabase_client = create_client(
-        settings.supabase_url, settings.supabase_service_role_key
-    )
+    with _supabase_client_lock:
+        if _supabase_client is None:
+            _supabase_client = create_client(
+                settings.supabase_url,
+                settings.supabase_service_role_key,
+                options=ClientOptions(httpx_client=_build_http_client(settings)),
+            )
     return _supabase_client
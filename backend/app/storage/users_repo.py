@@ -50,11 +50,12 @@ class UsersRepository:
         existing = self.get(user_id)
         if existing:
             return existing
+        now = now_kst().isoformat()
         row = {
             "id": user_id,
             "display_name": display_name,
-            "created_at": now_kst().isoformat(),
-            "updated_at": now_kst().isoformat(),
+            "created_at": now,
+            "updated_at": now,
         }
         if self.supabase is None:
             return row
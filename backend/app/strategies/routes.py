@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Header, Query
+import hashlib
+
+import anyio
+import orjson
+from fastapi import APIRouter, Header, Query, Response
+from fastapi.responses import ORJSONResponse
 
 from app.core.auth import resolve_my_user_id
 from app.core.config import get_settings
@@ -30,19 +35,30 @@ def _user(authorization: str | None) -> str:
     return resolve_my_user_id(get_settings(), authorization)
 
 
-@router.get("/public-strategies")
+@router.get("/public-strategies", response_class=ORJSONResponse)
 async def list_public_strategies(limit: int = Query(default=20, ge=1, le=100), cursor: str | None = Query(default=None), q: str | None = Query(default=None), tag: str | None = Query(default=None), category: str | None = Query(default=None), risk_level: str | None = Query(default=None), sort: str = Query(default="updated_at"), order: str = Query(default="desc")):
-    return _svc().list_public(limit=limit, cursor=cursor, q=q, tag=tag, category=category, risk_level=risk_level, sort=sort, order=order)
+    # Supabase calls are synchronous; run them off the event loop.
+    payload = await anyio.to_thread.run_sync(lambda: _svc().list_public(limit=limit, cursor=cursor, q=q, tag=tag, category=category, risk_level=risk_level, sort=sort, order=order))
+    # Plain dicts with no response_model: encode once with orjson, skipping jsonable_encoder.
+    return ORJSONResponse(payload)
 
 
 @router.get("/public-strategies/{public_strategy_id}", response_model=PublicStrategyDetail)
-async def get_public_strategy(public_strategy_id: str):
-    return _svc().get_public(public_strategy_id)
+async def get_public_strategy(public_strategy_id: str, if_none_match: str | None = Header(default=None, alias="If-None-Match")):
+    payload = await anyio.to_thread.run_sync(lambda: _svc().get_public(public_strategy_id))
+    # Detail rows change rarely: tag the encoded body so browsers/CDNs can revalidate with a 304.
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.post("/public-strategies/{public_strategy_id}/add", response_model=MyStrategy)
 async def add_public_strategy_to_my(public_strategy_id: str, payload: AddPublicStrategyRequest, authorization: str | None = Header(default=None, alias="Authorization")):
-    return _svc().add_public_to_my(_user(authorization), public_strategy_id, payload)
+    user_id = _user(authorization)
+    return await anyio.to_thread.run_sync(lambda: _svc().add_public_to_my(user_id, public_strategy_id, payload))
 
 
 @router.post("/public-strategies/{public_strategy_id}/validate", response_model=ValidateParamsResponse)
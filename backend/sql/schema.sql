@@ -55,9 +55,85 @@ alter table if exists public_strategies add column if not exists one_liner_ko te
 alter table if exists public_strategies add column if not exists full_description_ko text;
 alter table if exists public_strategies add column if not exists thesis_ko text;
 
-create index if not exists idx_public_strategies_updated_at on public_strategies(updated_at);
-create index if not exists idx_public_strategies_adds_count on public_strategies(adds_count);
-create index if not exists idx_public_strategies_name on public_strategies(name);
+create index if not exists idx_public_strategies_updated_at_id on public_strategies(updated_at, public_strategy_id);
+create index if not exists idx_public_strategies_adds_count_id on public_strategies(adds_count, public_strategy_id);
+create index if not exists idx_public_strategies_name_id on public_strategies(name, public_strategy_id);
+-- Superseded by the (column, public_strategy_id) keyset indexes above
+drop index if exists idx_public_strategies_updated_at;
+drop index if exists idx_public_strategies_adds_count;
+drop index if exists idx_public_strategies_name;
+create index if not exists idx_public_strategies_category_risk_updated_id
+  on public_strategies(category, risk_level, updated_at desc, public_strategy_id);
+
+-- Trigram GIN indexes so the list `q` filter (name/one_liner ILIKE '%q%') is index-backed
+create extension if not exists pg_trgm;
+create index if not exists idx_public_strategies_name_trgm on public_strategies using gin (name gin_trgm_ops);
+create index if not exists idx_public_strategies_one_liner_trgm on public_strategies using gin (one_liner gin_trgm_ops);
+-- tags is jsonb; the list `tag` filter is sent as cs.["tag"] (tags @> '["tag"]')
+create index if not exists idx_public_strategies_tags_gin on public_strategies using gin (tags jsonb_path_ops);
+
+-- One row per seeded dataset: hash of the seed inputs last reconciled, so startup can skip
+-- the seed pass when the deployed defaults have not changed.
+create table if not exists seed_markers (
+  key text primary key,
+  hash text not null,
+  updated_at timestamptz not null default now()
+);
+
+-- Reconciles the default public strategies in one round trip: inserts missing rows and, on
+-- existing ones, fills blank ko fields and replaces legacy English texts (p_legacy maps
+-- public_strategy_id -> {full_description, thesis}). Untouched rows are not rewritten.
+create or replace function seed_public_strategies(p_rows jsonb, p_legacy jsonb default '{}'::jsonb)
+returns integer
+language plpgsql
+as $$
+declare
+  v_count integer;
+begin
+  insert into public_strategies as ps
+  select p.*
+  from jsonb_array_elements(p_rows) r
+  cross join lateral jsonb_populate_record(
+    null::public_strategies,
+    r || jsonb_build_object('created_at', now(), 'updated_at', now())
+  ) p
+  on conflict (public_strategy_id) do update set
+    one_liner_ko = case when coalesce(btrim(ps.one_liner_ko), '') = ''
+      then coalesce(nullif(excluded.one_liner_ko, ''), ps.one_liner_ko) else ps.one_liner_ko end,
+    full_description_ko = case when coalesce(btrim(ps.full_description_ko), '') = ''
+      then coalesce(nullif(excluded.full_description_ko, ''), ps.full_description_ko) else ps.full_description_ko end,
+    thesis_ko = case when coalesce(btrim(ps.thesis_ko), '') = ''
+      then coalesce(nullif(excluded.thesis_ko, ''), ps.thesis_ko) else ps.thesis_ko end,
+    full_description = case
+      when coalesce(btrim(ps.full_description), '') = ''
+        or ps.full_description = p_legacy->ps.public_strategy_id->>'full_description'
+      then coalesce(nullif(excluded.full_description, ''), ps.full_description)
+      else ps.full_description end,
+    thesis = case
+      when coalesce(btrim(ps.thesis), '') = ''
+        or ps.thesis = p_legacy->ps.public_strategy_id->>'thesis'
+      then coalesce(nullif(excluded.thesis, ''), ps.thesis)
+      else ps.thesis end,
+    updated_at = now()
+  where (coalesce(btrim(ps.one_liner_ko), '') = '' and nullif(excluded.one_liner_ko, '') is not null)
+    or (coalesce(btrim(ps.full_description_ko), '') = '' and nullif(excluded.full_description_ko, '') is not null)
+    or (coalesce(btrim(ps.thesis_ko), '') = '' and nullif(excluded.thesis_ko, '') is not null)
+    or (
+      (coalesce(btrim(ps.full_description), '') = ''
+        or ps.full_description = p_legacy->ps.public_strategy_id->>'full_description')
+      and nullif(excluded.full_description, '') is distinct from ps.full_description
+      and nullif(excluded.full_description, '') is not null
+    )
+    or (
+      (coalesce(btrim(ps.thesis), '') = ''
+        or ps.thesis = p_legacy->ps.public_strategy_id->>'thesis')
+      and nullif(excluded.thesis, '') is distinct from ps.thesis
+      and nullif(excluded.thesis, '') is not null
+    );
+  get diagnostics v_count = row_count;
+  return v_count;
+end;
+$$;
 
 -- User strategies (instances)
 create table if not exists user_strategies (
@@ -145,7 +221,92 @@ create table if not exists portfolio_snapshots (
   created_at timestamptz not null default now()
 );
 
-create index if not exists idx_portfolio_snapshots_user_env_asof on portfolio_snapshots(user_id, environment, as_of);
+-- Older deployments could store the same (user, env, as_of) twice from concurrent
+-- delete+insert refreshes; keep the newest row of each before enforcing uniqueness.
+do $$
+begin
+  if not exists (select 1 from pg_indexes where indexname = 'uq_portfolio_snapshots_user_env_asof') then
+    delete from portfolio_snapshots a
+    using portfolio_snapshots b
+    where a.user_id = b.user_id
+      and a.environment = b.environment
+      and a.as_of = b.as_of
+      and a.snapshot_id < b.snapshot_id;
+  end if;
+end;
+$$;
+
+create unique index if not exists uq_portfolio_snapshots_user_env_asof on portfolio_snapshots(user_id, environment, as_of);
+-- Superseded by the unique index above
+drop index if exists idx_portfolio_snapshots_user_env_asof;
+
+create or replace view portfolio_equity_curve_v as
+  select user_id, environment, as_of as t, equity::float8 as equity
+  from portfolio_snapshots;
+
+-- Daily equity rollup (last snapshot of each day) for long-range curve reads. Readers append
+-- raw snapshots from the view's last day onward, so a stale (never refreshed) view stays correct.
+-- Days are KST calendar days (the app's timezone), not the session's UTC days.
+do $$
+begin
+  if exists (
+    select 1 from pg_matviews
+    where matviewname = 'portfolio_equity_daily'
+      and definition not like '%Asia/Seoul%'
+  ) then
+    drop materialized view portfolio_equity_daily;
+  end if;
+end;
+$$;
+
+create materialized view if not exists portfolio_equity_daily as
+  select distinct on (user_id, environment, day)
+    user_id,
+    environment,
+    day as t,
+    equity::float8 as equity
+  from (
+    select
+      user_id,
+      environment,
+      as_of,
+      equity,
+      date_trunc('day', as_of at time zone 'Asia/Seoul') at time zone 'Asia/Seoul' as day
+    from portfolio_snapshots
+  ) s
+  order by user_id, environment, day, as_of desc;
+
+create unique index if not exists uq_portfolio_equity_daily_user_env_t
+  on portfolio_equity_daily(user_id, environment, t);
+
+-- Refresh every 15 minutes where pg_cron is available
+do $$
+begin
+  if exists (select 1 from pg_extension where extname = 'pg_cron') then
+    perform cron.schedule(
+      'refresh_portfolio_equity_daily',
+      '*/15 * * * *',
+      'refresh materialized view concurrently portfolio_equity_daily'
+    );
+  end if;
+end;
+$$;
+
+-- Replaces one user's snapshot window in a single transaction (rows must be sorted by as_of).
+create or replace function replace_equity_curve(p_user uuid, p_env text, p_rows jsonb)
+returns void
+language plpgsql
+as $$
+begin
+  delete from portfolio_snapshots
+  where user_id = p_user
+    and environment = p_env
+    and as_of between (p_rows->0->>'as_of')::timestamptz and (p_rows->-1->>'as_of')::timestamptz;
+  insert into portfolio_snapshots(user_id, environment, as_of, equity, cash)
+  select p_user, p_env, (e->>'as_of')::timestamptz, (e->>'equity')::numeric, (e->>'cash')::numeric
+  from jsonb_array_elements(p_rows) e;
+end;
+$$;
 
 -- Positions
 create table if not exists positions (
@@ -163,6 +324,49 @@ create table if not exists positions (
 create index if not exists idx_positions_user_env on positions(user_id, environment);
 create index if not exists idx_positions_user_symbol on positions(user_id, symbol);
 
+-- Filtered position listing in one call. Side is derived from the sign of qty, as the API
+-- does; only whitelisted columns reach ORDER BY, quoted with %I.
+create or replace function list_positions(
+  p_user_id uuid,
+  p_env text,
+  p_q text default null,
+  p_side text default null,
+  p_strategy_id text default null,
+  p_sort text default null,
+  p_order_desc boolean default true,
+  p_limit int default 200
+)
+returns setof positions
+language plpgsql stable
+as $$
+declare
+  v_order text := '';
+  v_q text;
+begin
+  if p_q is not null then
+    v_q := '%' || replace(replace(replace(p_q, '\', '\\'), '%', '\%'), '_', '\_') || '%';
+  end if;
+  if p_sort in ('symbol', 'unrealized_pnl') then
+    v_order := format(
+      ' order by %I %s nulls last',
+      p_sort,
+      case when p_order_desc then 'desc' else 'asc' end
+    );
+  end if;
+  return query execute
+    $q$
+    select p.*
+    from positions p
+    where p.user_id = $1
+      and p.environment = $2
+      and ($3::text is null or p.symbol ilike $3)
+      and ($4::text is null or $4 = 'all' or ($4 = 'short') = (p.qty < 0))
+      and ($5::text is null or p.strategy_id = $5)
+    $q$ || v_order || ' limit $6'
+    using p_user_id, p_env, v_q, p_side, p_strategy_id, p_limit;
+end;
+$$;
+
 -- Trades (fills)
 create table if not exists trades (
   fill_id text primary key,
@@ -215,6 +419,12 @@ alter table if exists orders add column if not exists source text not null defau
 alter table if exists orders add column if not exists requested_notional numeric;
 alter table if exists orders add column if not exists estimated_price numeric;
 create index if not exists idx_orders_rebalance_run_id on orders(rebalance_run_id);
+-- Normalized status ("OrderStatus.FILLED" -> "filled") used by the order list scope filters
+alter table if exists orders add column if not exists status_norm text
+  generated always as (regexp_replace(lower(trim(coalesce(status, ''))), '^.*\.', '')) stored;
+create index if not exists idx_orders_user_env_open_submitted
+  on orders(user_id, environment, submitted_at desc)
+  where status_norm not in ('filled','canceled','cancelled','rejected','expired');
 
 -- Rebalance targets (latest target allocation saved from Portfolio)
 create table if not exists rebalance_targets (
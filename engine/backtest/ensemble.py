@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+import numpy as np
 
 from engine.backtest.metrics import compute_drawdown, compute_metrics, compute_returns
 
 
-@dataclass
+@dataclass(slots=True)
 class EnsembleStrategyContext:
     strategy_id: str
     params: Dict[str, Any]
@@ -16,160 +20,227 @@ class EnsembleStrategyContext:
 SimulationProgressCallback = Callable[[float], None]
 
 
-def _is_rebalance_day(date_index: int, rebalance: str) -> bool:
-    if rebalance == "daily":
-        return True
-    if rebalance == "weekly":
-        return date_index % 5 == 0
-    if rebalance == "monthly":
-        return date_index % 21 == 0
-    return False
+class PriceTable(NamedTuple):
+    """가격 데이터의 열 지향(SoA) 표현. matrix는 (날짜 수, 종목 수) float64, 결측은 NaN."""
+
+    tickers: List[str]
+    dates: List[str]
+    ticker_idx: Dict[str, int]
+    date_idx: Dict[str, int]
+    matrix: np.ndarray
 
 
-def compute_momentum_weights(
+def build_price_table(
     prices: Dict[str, Dict[str, float]],
-    dates: List[str],
-    index: int,
-    lookback: int,
-    top_k: int,
-) -> Dict[str, float]:
-    """룩백 기간 수익률 기준 상위 top_k 종목에 균등 비중 반환."""
-    if index - lookback < 0:
-        return {}
-    returns = []
-    for ticker, series in prices.items():
-        start = series.get(dates[index - lookback])
-        end = series.get(dates[index])
-        if start and end:
-            returns.append((ticker, (end / start) - 1))
-    returns.sort(key=lambda x: x[1], reverse=True)
-    selected = [t for t, _ in returns[:top_k]]
-    if not selected:
-        return {}
-    weight = 1 / len(selected)
-    return {ticker: weight for ticker in selected}
-
-
-def normalize_weights(weights: Dict[str, float]) -> Dict[str, float]:
-    total = sum(abs(w) for w in weights.values())
+    dates: List[str] | None = None,
+) -> PriceTable:
+    """{ticker: {date: price}} 중첩 dict를 PriceTable로 변환한다.
+
+    dates를 생략하면 첫 번째 종목의 날짜 순서를 기준 축으로 사용한다.
+    """
+    tickers = list(prices.keys())
+    if dates is None:
+        dates = list(next(iter(prices.values())).keys()) if prices else []
+    ticker_idx = {ticker: j for j, ticker in enumerate(tickers)}
+    date_idx = {date: i for i, date in enumerate(dates)}
+    matrix = np.full((len(dates), len(tickers)), np.nan, dtype=np.float64)
+    for j, series in enumerate(prices.values()):
+        for date, price in series.items():
+            i = date_idx.get(date)
+            if i is not None and price is not None:
+                matrix[i, j] = price
+    return PriceTable(tickers, dates, ticker_idx, date_idx, matrix)
+
+
+def _daily_returns(matrix: np.ndarray) -> np.ndarray:
+    """전일 대비 수익률 행렬. 첫 행과 가격이 없거나 0인 칸은 0.0으로 둔다."""
+    rets = np.zeros_like(matrix)
+    if len(matrix) < 2:
+        return rets
+    prev = matrix[:-1]
+    curr = matrix[1:]
+    valid = ~np.isnan(prev) & ~np.isnan(curr) & (prev != 0) & (curr != 0)
+    np.divide(curr, prev, out=rets[1:], where=valid)
+    rets[1:][valid] -= 1
+    return rets
+
+
+_REBALANCE_STEPS = {"daily": 1, "weekly": 5, "monthly": 21}
+
+
+def _rebalance_mask(total: int, rebalance: str) -> np.ndarray:
+    """날짜 인덱스별 리밸런싱 여부를 한 번에 계산한 bool 마스크. 알 수 없는 주기는 리밸런싱 없음."""
+    step = _REBALANCE_STEPS.get(rebalance)
+    if step is None:
+        return np.zeros(total, dtype=bool)
+    return np.arange(total) % step == 0
+
+
+def momentum_selection(table: PriceTable, lookback: int, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """전 기간 모멘텀 선택 결과를 (비중 행렬, 순위 행렬)로 반환한다. 둘 다 (날짜 수, 종목 수).
+
+    순위 행렬은 선택된 칸에 수익률 내림차순 순위(0부터)를, 선택되지 않은 칸에 -1을 담는다.
+    """
+    total, n_tickers = table.matrix.shape
+    out = np.zeros((total, n_tickers), dtype=np.float64)
+    ranks = np.full((total, n_tickers), -1, dtype=np.int64)
+    if top_k <= 0 or lookback < 0 or lookback >= total or not n_tickers:
+        return out, ranks
+    start = table.matrix[: total - lookback]
+    end = table.matrix[lookback:]
+    valid = ~np.isnan(start) & ~np.isnan(end) & (start != 0) & (end != 0)
+    # 수익률 내림차순 = (1 - end/start) 오름차순. 무효 칸은 inf로 두어 항상 뒤로 보낸다.
+    neg_returns = np.full(start.shape, np.inf)
+    np.divide(end, start, out=neg_returns, where=valid)
+    neg_returns[valid] = 1 - neg_returns[valid]
+    order = np.argsort(neg_returns, axis=1, kind="stable")[:, :top_k]
+    counts = np.minimum(valid.sum(axis=1), top_k)
+    row_weight = np.divide(1.0, counts, out=np.zeros(len(counts)), where=counts > 0)
+    picked = np.take_along_axis(valid, order, axis=1)
+    rows = np.arange(len(order))[:, None]
+    out[lookback:][rows, order] = np.where(picked, row_weight[:, None], 0.0)
+    ranks[lookback:][rows, order] = np.where(picked, np.arange(order.shape[1])[None, :], -1)
+    return out, ranks
+
+
+def momentum_weight_matrix(table: PriceTable, lookback: int, top_k: int) -> np.ndarray:
+    """룩백 기간 수익률 상위 top_k 종목에 균등 비중을 준 (날짜 수, 종목 수) 비중 행렬."""
+    return momentum_selection(table, lookback, top_k)[0]
+
+
+def mix_tie_order(strategy_ranks: np.ndarray) -> np.ndarray:
+    """혼합 비중 동률을 깰 종목별 정렬 키. (전략 수, 종목 수) 순위 배열을 받는다.
+
+    원래 dict 기반 혼합은 전략 순서대로, 각 전략 안에서는 모멘텀 순위대로 종목을 처음 넣은 순서가
+    동률 순서였다. 그 순서를 (전략 위치, 순위)의 최솟값으로 재현하고, 어느 전략도 고르지 않은
+    종목은 맨 뒤로 보낸다.
+    """
+    n_strategies, n_tickers = strategy_ranks.shape
+    unpicked = n_strategies * (n_tickers + 1)
+    offsets = np.arange(n_strategies, dtype=np.int64)[:, None] * (n_tickers + 1)
+    keys = np.where(strategy_ranks >= 0, offsets + strategy_ranks, unpicked)
+    return keys.min(axis=0) if n_strategies else np.full(n_tickers, unpicked, dtype=np.int64)
+
+
+def normalize_weights_vec(w_vec: np.ndarray) -> np.ndarray:
+    """dense 비중 벡터를 절대값 합으로 나눠 정규화한다."""
+    total = np.abs(w_vec).sum()
     if total == 0:
-        return weights
-    return {k: v / total for k, v in weights.items()}
+        return w_vec
+    return w_vec / total
+
+
+def vec_to_weights(table: PriceTable, w_vec: np.ndarray) -> Dict[str, float]:
+    """dense 비중 벡터에서 0이 아닌 종목만 {ticker: weight} dict로 꺼낸다."""
+    return {table.tickers[j]: float(w_vec[j]) for j in np.flatnonzero(w_vec)}
 
 
-def apply_constraints(weights: Dict[str, float], constraints: Dict[str, Any]) -> Dict[str, float]:
+def apply_constraints_vec(
+    w_vec: np.ndarray,
+    constraints: Dict[str, Any],
+    tie_order: np.ndarray | None = None,
+) -> np.ndarray:
+    """앙상블 제약 조건을 dense 비중 벡터에 적용한다. 새 배열을 만들지 않고 w_vec 한 버퍼에서 처리한다.
+
+    max_positions 동률은 tie_order(작을수록 우선) 순서로 정하고, 없으면 table.tickers 순서를 쓴다.
+    """
     if constraints.get("max_weight_per_symbol") is not None:
-        max_w = constraints["max_weight_per_symbol"]
-        weights = {k: min(v, max_w) for k, v in weights.items()}
+        np.minimum(w_vec, constraints["max_weight_per_symbol"], out=w_vec)
     if constraints.get("min_trade_weight") is not None:
-        min_w = constraints["min_trade_weight"]
-        weights = {k: v for k, v in weights.items() if abs(v) >= min_w}
+        w_vec[np.abs(w_vec) < constraints["min_trade_weight"]] = 0.0
     if constraints.get("max_positions") is not None:
-        max_pos = constraints["max_positions"]
-        sorted_items = sorted(weights.items(), key=lambda x: abs(x[1]), reverse=True)
-        weights = dict(sorted_items[:max_pos])
+        max_pos = max(int(constraints["max_positions"]), 0)
+        if max_pos < len(w_vec):
+            if tie_order is None:
+                keep = np.argsort(-np.abs(w_vec), kind="stable")[:max_pos]
+            else:
+                keep = np.lexsort((tie_order, -np.abs(w_vec)))[:max_pos]
+            mask = np.zeros(len(w_vec), dtype=bool)
+            mask[keep] = True
+            w_vec[~mask] = 0.0
     buffer_pct = constraints.get("cash_buffer_pct")
     if constraints.get("normalize_weights", True):
-        weights = normalize_weights(weights)
+        total = np.abs(w_vec).sum()
+        if total != 0:
+            w_vec /= total
         if buffer_pct is not None:
-            scale = max(0.0, 1 - buffer_pct)
-            weights = {k: v * scale for k, v in weights.items()}
+            w_vec *= max(0.0, 1 - buffer_pct)
     elif buffer_pct is not None:
-        weights = {k: v * (1 - buffer_pct) for k, v in weights.items()}
-    return weights
-
-
-def mix_weights(
-    strategy_weights: Dict[str, Dict[str, float]],
-    mix_weights_map: Dict[str, float],
-    constraints: Dict[str, Any],
-) -> Dict[str, float]:
-    combined: Dict[str, float] = {}
-    for strat_id, weights in strategy_weights.items():
-        factor = mix_weights_map.get(strat_id, 0.0)
-        for ticker, w in weights.items():
-            combined[ticker] = combined.get(ticker, 0.0) + factor * w
-    return apply_constraints(combined, constraints)
+        w_vec *= 1 - buffer_pct
+    return w_vec
 
 
 def simulate_portfolio(
-    prices: Dict[str, Dict[str, float]],
-    dates: List[str],
+    table: PriceTable,
     rebalance: str,
     fee_bps: float,
     slippage_bps: float,
-    weight_fn: Callable[[int, str], Dict[str, float]],
+    weight_fn: Callable[[int, str], np.ndarray],
     initial_cash: float,
     progress_cb: SimulationProgressCallback | None = None,
-) -> Tuple[List[Dict[str, float]], float, List[int], List[Dict[str, Any]]]:
+) -> Tuple[List[Dict[str, float]], float, np.ndarray, List[Dict[str, Any]]]:
     """가격 데이터와 비중 함수로 포트폴리오를 시뮬레이션한다.
 
+    weight_fn은 table.tickers 순서의 dense 비중 벡터를 반환해야 한다.
+
     Returns:
         (equity_curve, turnover_pct, positions_counts, holdings_history)
     """
+    dates = table.dates
+    daily_rets = _daily_returns(table.matrix)
     equity = initial_cash
-    equity_curve: List[Dict[str, float]] = []
-    weights: Dict[str, float] = {}
-    turnovers: List[float] = []
-    positions_counts: List[int] = []
+    weights = np.zeros(len(table.tickers), dtype=np.float64)
     holdings_history: List[Dict[str, Any]] = []
 
     total = len(dates)
+    turnovers = np.zeros(total, dtype=np.float64)
+    positions_counts = np.empty(total, dtype=np.int32)
+    equity_arr = np.empty(total, dtype=np.float64)
     stride = max(total // 50, 1) if total else 1
+    rebalance_mask = _rebalance_mask(total, rebalance)
+    cost_per_turnover = (fee_bps + slippage_bps) / 10000
     if progress_cb and total:
         progress_cb(0.0)
 
-    for idx, date in enumerate(dates):
-        if _is_rebalance_day(idx, rebalance):
-            new_weights = weight_fn(idx, date)
-            new_weights = normalize_weights(new_weights)
-            turnover = sum(
-                abs(new_weights.get(k, 0.0) - weights.get(k, 0.0))
-                for k in set(new_weights) | set(weights)
-            )
-            cost = turnover * (fee_bps + slippage_bps) / 10000
-            equity *= 1 - cost
-            weights = new_weights
-            turnovers.append(turnover)
-        else:
-            turnovers.append(0.0)
-
-        daily_ret = 0.0
-        for ticker, w in weights.items():
-            series = prices.get(ticker, {})
-            prev_price = series.get(dates[idx - 1]) if idx > 0 else None
-            price = series.get(date)
-            if prev_price and price:
-                daily_ret += w * (price / prev_price - 1)
-        equity *= 1 + daily_ret
-        positions_counts.append(len([w for w in weights.values() if w != 0]))
-        equity_curve.append({"date": date, "equity": equity})
-
-        if total:
+    # 진행률 콜백은 stride 단위 청크가 끝날 때만 호출해 일별 루프에서 분기를 없앤다
+    for chunk_start in range(0, total, stride):
+        chunk_end = min(chunk_start + stride, total)
+        for idx in range(chunk_start, chunk_end):
+            date = dates[idx]
+            if rebalance_mask[idx]:
+                new_weights = normalize_weights_vec(weight_fn(idx, date))
+                turnover = float(np.abs(new_weights - weights).sum())
+                cost = turnover * cost_per_turnover
+                equity *= 1 - cost
+                weights = new_weights
+                turnovers[idx] = turnover
+
+            daily_ret = float(daily_rets[idx] @ weights)
+            equity *= 1 + daily_ret
+            positions_counts[idx] = np.count_nonzero(weights)
+            equity_arr[idx] = equity
+
             is_month_end = idx == total - 1 or dates[idx + 1][:7] != date[:7]
             if is_month_end:
-                snapshot = {k: v for k, v in weights.items() if v != 0}
-                holdings_history.append({"month": date[:7], "weights": snapshot})
+                holdings_history.append({"month": date[:7], "weights": vec_to_weights(table, weights)})
 
-        if progress_cb and total:
-            step = idx + 1
-            if step % stride == 0 or step == total:
-                progress_cb(step / total)
+        if progress_cb:
+            progress_cb(chunk_end / total)
 
-    turnover_pct = sum(turnovers) / max(len(turnovers), 1) * 100
+    equity_curve = [{"date": d, "equity": e} for d, e in zip(dates, equity_arr.tolist())]
+    turnover_pct = float(turnovers.sum()) / max(total, 1) * 100
     return equity_curve, turnover_pct, positions_counts, holdings_history
 
 
 def run_single(
-    prices: Dict[str, Dict[str, float]],
-    dates: List[str],
+    table: PriceTable,
     spec: Dict[str, Any],
     strategy_ctx: EnsembleStrategyContext,
     benchmark_curve: List[Dict[str, float]] | None = None,
     progress_cb: SimulationProgressCallback | None = None,
 ) -> Dict[str, Any]:
     """단일 전략 앙상블 백테스트 실행."""
-    if not dates:
+    if not table.dates:
         empty: List[Dict[str, float]] = []
         return {
             "equity_curve": empty,
@@ -183,12 +254,13 @@ def run_single(
     lookback = int(params.get("lookback", 60))
     top_k = int(params.get("top_k", 10))
 
-    def weight_fn(idx: int, date: str) -> Dict[str, float]:
-        return compute_momentum_weights(prices, dates, idx, lookback, top_k)
+    weight_matrix = momentum_weight_matrix(table, lookback, top_k)
+
+    def weight_fn(idx: int, date: str) -> np.ndarray:
+        return weight_matrix[idx]
 
     equity_curve, turnover_pct, positions_counts, holdings_history = simulate_portfolio(
-        prices,
-        dates,
+        table,
         spec["rebalance"],
         spec["fee_bps"],
         spec["slippage_bps"],
@@ -201,8 +273,8 @@ def run_single(
     drawdown = compute_drawdown(equity_curve)
     metrics = compute_metrics(equity_curve, benchmark_curve=benchmark_curve, turnover_pct=turnover_pct)
     positions_summary = {
-        "avg_positions": sum(positions_counts) / len(positions_counts),
-        "max_positions": max(positions_counts),
+        "avg_positions": float(positions_counts.mean()),
+        "max_positions": int(positions_counts.max()),
     }
     return {
         "equity_curve": equity_curve,
@@ -215,8 +287,7 @@ def run_single(
 
 
 def run_ensemble(
-    prices: Dict[str, Dict[str, float]],
-    dates: List[str],
+    table: PriceTable,
     spec: Dict[str, Any],
     strategies: List[EnsembleStrategyContext],
     ensemble: Dict[str, Any],
@@ -224,7 +295,7 @@ def run_ensemble(
     progress_cb: SimulationProgressCallback | None = None,
 ) -> Dict[str, Any]:
     """여러 전략을 혼합하는 앙상블 백테스트 실행."""
-    if not dates:
+    if not table.dates:
         empty: List[Dict[str, float]] = []
         return {
             "equity_curve": empty,
@@ -237,29 +308,41 @@ def run_ensemble(
     mix_w = ensemble.get("weights", {})
     constraints = ensemble.get("constraints", {}) or {}
 
-    weight_functions = {
-        ctx.strategy_id: (
-            lambda idx, date, _ctx=ctx: compute_momentum_weights(
-                prices,
-                dates,
-                idx,
-                int(_ctx.params.get("lookback", 60)),
-                int(_ctx.params.get("top_k", 10)),
-            )
+    # strategy_id가 중복되면 마지막 컨텍스트만 사용한다
+    unique_ctxs = list({ctx.strategy_id: ctx for ctx in strategies}.items())
+    mix_vec = np.array([mix_w.get(strat_id, 0.0) for strat_id, _ in unique_ctxs], dtype=np.float64)
+
+    def _strategy_selection(ctx: EnsembleStrategyContext) -> Tuple[np.ndarray, np.ndarray]:
+        return momentum_selection(
+            table,
+            int(ctx.params.get("lookback", 60)),
+            int(ctx.params.get("top_k", 10)),
         )
-        for ctx in strategies
-    }
 
-    def mixed_weight_fn(idx: int, date: str) -> Dict[str, float]:
-        strategy_weights = {
-            ctx.strategy_id: weight_functions[ctx.strategy_id](idx, date)
-            for ctx in strategies
-        }
-        return mix_weights(strategy_weights, mix_w, constraints)
+    # 전략별 비중은 서로 독립이므로 날짜 루프 밖에서 (K, T, N) 텐서로 미리 계산한다.
+    # NumPy 연산은 GIL을 풀기 때문에 스레드 풀로 전략 간 병렬 처리가 가능하다.
+    ctx_list = [ctx for _, ctx in unique_ctxs]
+    if len(ctx_list) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(ctx_list), os.cpu_count() or 1)) as pool:
+            per_strategy = list(pool.map(_strategy_selection, ctx_list))
+    else:
+        per_strategy = [_strategy_selection(ctx) for ctx in ctx_list]
+    if per_strategy:
+        strategy_weight_tensor = np.stack([weights for weights, _ in per_strategy])
+        strategy_rank_tensor = np.stack([ranks for _, ranks in per_strategy])
+    else:
+        strategy_weight_tensor = np.zeros((0, *table.matrix.shape), dtype=np.float64)
+        strategy_rank_tensor = np.zeros((0, *table.matrix.shape), dtype=np.int64)
+    # 동률 순서는 max_positions를 적용할 때만 필요하다
+    needs_tie_order = constraints.get("max_positions") is not None
+
+    def mixed_weight_fn(idx: int, date: str) -> np.ndarray:
+        mixed = np.einsum("k,kn->n", mix_vec, strategy_weight_tensor[:, idx, :])
+        tie_order = mix_tie_order(strategy_rank_tensor[:, idx, :]) if needs_tie_order else None
+        return apply_constraints_vec(mixed, constraints, tie_order)
 
     equity_curve, turnover_pct, positions_counts, holdings_history = simulate_portfolio(
-        prices,
-        dates,
+        table,
         spec["rebalance"],
         spec["fee_bps"],
         spec["slippage_bps"],
@@ -275,7 +358,7 @@ def run_ensemble(
         "metrics": compute_metrics(equity_curve, benchmark_curve=benchmark_curve, turnover_pct=turnover_pct),
         "holdings_history": holdings_history,
         "positions_summary": {
-            "avg_positions": sum(positions_counts) / len(positions_counts),
-            "max_positions": max(positions_counts),
+            "avg_positions": float(positions_counts.mean()),
+            "max_positions": int(positions_counts.max()),
         },
     }
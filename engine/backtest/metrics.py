@@ -1,7 +1,37 @@
 from __future__ import annotations
 
+import hashlib
 import math
-from typing import Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def _equity_array(equity_curve: List[Dict[str, float]]) -> np.ndarray:
+    # 자산 곡선의 equity 값만 float64 배열로 꺼낸다 (지표 계산은 날짜를 쓰지 않는다).
+    return np.fromiter(
+        (point["equity"] for point in equity_curve), dtype=np.float64, count=len(equity_curve)
+    )
+
+
+def _returns_array(equities: np.ndarray) -> np.ndarray:
+    # 일간 수익률 배열 (N개 equity → N-1개 수익률). 전일 equity가 0이면 수익률 0으로 처리한다.
+    prev = equities[:-1]
+    rets = np.zeros(max(equities.size - 1, 0), dtype=np.float64)
+    nonzero = prev != 0
+    rets[nonzero] = equities[1:][nonzero] / prev[nonzero] - 1.0
+    return rets
+
+
+def _drawdown_array(equities: np.ndarray) -> np.ndarray:
+    # 고점 대비 낙폭(%) 배열. 고점은 np.maximum.accumulate로 한 번에 누적 계산한다.
+    peaks = np.maximum.accumulate(equities)
+    dd = np.zeros_like(equities)
+    nonzero = peaks != 0
+    dd[nonzero] = (equities[nonzero] - peaks[nonzero]) / peaks[nonzero] * 100
+    return dd
 
 
 def compute_returns(equity_curve: List[Dict[str, float]]) -> List[Dict[str, float]]:
@@ -9,17 +39,11 @@ def compute_returns(equity_curve: List[Dict[str, float]]) -> List[Dict[str, floa
     # equity_curve는 [{"date": "2020-01-02", "equity": 10050.0}, ...] 형식이다.
     # 첫 번째 포인트는 기준값이므로 수익률 계산에서 제외된다 (N개 포인트 → N-1개 수익률).
     # 반환값: [{"date": "2020-01-03", "ret": 0.005}, ...] (ret = 일간 수익률, 소수)
-    returns: List[Dict[str, float]] = []
-    prev = None
-    for point in equity_curve:
-        equity = point["equity"]
-        if prev is None:
-            prev = equity
-            continue
-        ret = (equity / prev - 1.0) if prev else 0.0
-        returns.append({"date": point["date"], "ret": ret})
-        prev = equity
-    return returns
+    rets = _returns_array(_equity_array(equity_curve)).tolist()
+    return [
+        {"date": point["date"], "ret": ret}
+        for point, ret in zip(equity_curve[1:], rets)
+    ]
 
 
 def compute_drawdown(equity_curve: List[Dict[str, float]]) -> List[Dict[str, float]]:
@@ -27,26 +51,21 @@ def compute_drawdown(equity_curve: List[Dict[str, float]]) -> List[Dict[str, flo
     # 고점은 그 시점까지의 최고 자산 가치를 추적하여 갱신한다.
     # 반환값: [{"date": "...", "dd_pct": -5.2}, ...] (dd_pct = 음수, 고점 대비 하락률 %)
     # MDD(Maximum Drawdown)는 반환 리스트에서 dd_pct의 최솟값이다.
-    drawdown: List[Dict[str, float]] = []
-    peak = None
-    for point in equity_curve:
-        equity = point["equity"]
-        if peak is None or equity > peak:
-            peak = equity   # 새로운 고점 갱신
-        dd = (equity - peak) / peak * 100 if peak else 0.0
-        drawdown.append({"date": point["date"], "dd_pct": dd})
-    return drawdown
-
-
-def _stats(returns: List[float]) -> Tuple[float, float]:
-    # 수익률 리스트의 평균(mean)과 표준편차(std)를 반환한다.
-    # 표준편차는 모집단 표준편차(N으로 나눔)를 사용한다.
-    # 빈 리스트이면 (0.0, 0.0)을 반환한다.
-    if not returns:
-        return 0.0, 0.0
-    mean = sum(returns) / len(returns)
-    var = sum((r - mean) ** 2 for r in returns) / len(returns)
-    return mean, math.sqrt(var)
+    dd = _drawdown_array(_equity_array(equity_curve)).tolist()
+    return [
+        {"date": point["date"], "dd_pct": value}
+        for point, value in zip(equity_curve, dd)
+    ]
+
+
+_METRICS_CACHE_SIZE = 256
+_metrics_cache: OrderedDict[tuple, Dict[str, float]] = OrderedDict()
+_metrics_cache_lock = threading.Lock()
+
+
+def _fingerprint(equities: np.ndarray) -> bytes:
+    # equity 배열의 바이트 내용으로 만든 짧은 다이제스트 (캐시 키)
+    return hashlib.blake2b(equities.tobytes(), digest_size=16).digest()
 
 
 def compute_metrics(
@@ -69,7 +88,52 @@ def compute_metrics(
     #   information_ratio  : 초과 수익률 / tracking_error (위험 대비 초과 성과)
     #   turnover_pct       : 평균 일간 회전율 (호출자가 외부에서 전달)
 
-    if not equity_curve:
+    # equity 값은 여기서 한 번만 배열로 꺼내 캐시 키와 지표 계산에 같이 쓴다.
+    equities = _equity_array(equity_curve)
+    bench_equities = _equity_array(benchmark_curve) if benchmark_curve else None
+    return compute_metrics_from_arrays(equities, bench_equities, turnover_pct)
+
+
+def compute_metrics_from_arrays(
+    equities: np.ndarray,
+    bench_equities: Optional[np.ndarray] = None,
+    turnover_pct: float = 0.0,
+) -> Dict[str, float]:
+    # compute_metrics와 같은 지표를 equity 배열(float64)에서 바로 계산한다.
+    # 저장소에서 배열로 읽어 온 곡선(list_equity_curve_arrays)은 dict 변환 없이 이 함수를 쓴다.
+    #
+    # 같은 곡선에 대한 반복 호출(탭 전환, 벤치마크 재조회 등)은 캐시된 결과를 돌려준다.
+    # 지표는 equity 값에만 의존하므로 날짜는 키에 넣지 않는다.
+    equities = np.ascontiguousarray(equities, dtype=np.float64)
+    if bench_equities is not None:
+        bench_equities = np.ascontiguousarray(bench_equities, dtype=np.float64)
+        if bench_equities.size == 0:
+            bench_equities = None
+    key = (
+        _fingerprint(equities),
+        _fingerprint(bench_equities) if bench_equities is not None else None,
+        float(turnover_pct),
+    )
+    with _metrics_cache_lock:
+        cached = _metrics_cache.get(key)
+        if cached is not None:
+            _metrics_cache.move_to_end(key)
+            return dict(cached)
+
+    metrics = _compute_metrics(equities, bench_equities, turnover_pct)
+    with _metrics_cache_lock:
+        _metrics_cache[key] = metrics
+        if len(_metrics_cache) > _METRICS_CACHE_SIZE:
+            _metrics_cache.popitem(last=False)
+    return dict(metrics)
+
+
+def _compute_metrics(
+    equities: np.ndarray,
+    bench_equities: Optional[np.ndarray],
+    turnover_pct: float,
+) -> Dict[str, float]:
+    if equities.size == 0:
         return {
             "total_return_pct": 0.0,
             "cagr_pct": 0.0,
@@ -84,10 +148,16 @@ def compute_metrics(
         }
 
     # 시작 대비 최종 자산 가치로 총 수익률 계산
-    total_return_pct = (equity_curve[-1]["equity"] / equity_curve[0]["equity"] - 1) * 100
+    first, last = float(equities[0]), float(equities[-1])
+    total_return_pct = (last / first - 1) * 100
 
-    returns = [item["ret"] for item in compute_returns(equity_curve)]
-    mean, std = _stats(returns)
+    # 수익률은 배열로 한 번만 계산해 변동성, 샤프, 벤치마크 지표에 재사용한다
+    returns = _returns_array(equities)
+    # 평균/표준편차는 배열 메서드로 바로 구한다 (np.std는 SIMD 리덕션, 파이썬 제곱 루프 없음)
+    if returns.size:
+        mean, std = float(returns.mean()), float(returns.std())
+    else:
+        mean, std = 0.0, 0.0
 
     # 일간 표준편차에 √252를 곱해 연율화 변동성으로 변환
     volatility_pct = std * math.sqrt(252) * 100 if std else 0.0
@@ -97,36 +167,40 @@ def compute_metrics(
 
     # CAGR: (최종자산/초기자산)^(252/기간일수) - 1
     # 252 거래일 = 1년으로 가정하여 연율화
-    periods = max(len(returns), 1)
-    cagr_pct = ((equity_curve[-1]["equity"] / equity_curve[0]["equity"]) ** (252 / periods) - 1) * 100
+    periods = max(returns.size, 1)
+    cagr_pct = ((last / first) ** (252 / periods) - 1) * 100
 
-    drawdown = compute_drawdown(equity_curve)
-    max_drawdown_pct = min((d["dd_pct"] for d in drawdown), default=0.0)
+    # MDD만 필요하므로 날짜별 dict를 만들지 않고 낙폭 배열의 최솟값을 바로 구한다
+    max_drawdown_pct = float(_drawdown_array(equities).min())
 
-    # 벤치마크 대비 지표 (benchmark_curve가 있을 때만 계산)
+    # 벤치마크 대비 지표 (bench_equities가 있을 때만 계산)
     alpha_pct = 0.0
     beta = 0.0
     tracking_error_pct = 0.0
     information_ratio = 0.0
 
-    if benchmark_curve:
-        bench_returns = [item["ret"] for item in compute_returns(benchmark_curve)]
-        if bench_returns:
-            mean_b, std_b = _stats(bench_returns)
+    if bench_equities is not None:
+        b_arr = _returns_array(bench_equities)
+        if b_arr.size:
+            mean_b, std_b = float(b_arr.mean()), float(b_arr.std())
+
+            # 두 수익률 시계열은 짧은 쪽 길이만큼 앞에서부터 맞춰 비교한다
+            n = min(returns.size, b_arr.size)
+            r_arr, b_arr_n = returns[:n], b_arr[:n]
 
             # 베타 = Cov(전략 수익률, 벤치마크 수익률) / Var(벤치마크 수익률)
-            cov = sum(
-                (r - mean) * (b - mean_b)
-                for r, b in zip(returns, bench_returns)
-            ) / len(bench_returns)
-            beta = cov / (std_b ** 2) if std_b else 0.0
+            # 평균은 위에서 구한 값을 재사용하고, 공분산은 중심화된 두 배열의 내적 한 번으로 구한다
+            cov = float(np.dot(r_arr - mean, b_arr_n - mean_b)) / b_arr.size
+            beta = cov / (std_b * std_b) if std_b else 0.0
 
             # 알파 = 전략 수익률 - β × 벤치마크 수익률 (연율화)
             alpha_pct = ((mean - beta * mean_b) * 252) * 100
 
             # 초과 수익률(active return) 시계열의 표준편차로 tracking error 계산
-            diff = [r - b for r, b in zip(returns, bench_returns)]
-            mean_diff, std_diff = _stats(diff)
+            # diff 배열은 한 번만 만들고 평균/표준편차를 배열 메서드로 바로 구한다
+            diff = r_arr - b_arr_n
+            mean_diff = float(diff.mean()) if n else 0.0
+            std_diff = float(diff.std()) if n else 0.0
             tracking_error_pct = std_diff * math.sqrt(252) * 100 if std_diff else 0.0
 
             # 정보 비율 = 연율화 초과 수익률 / tracking error
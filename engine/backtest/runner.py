@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Dict, List
 
+import numpy as np
 import pandas as pd
 
 from engine.data.protocol import DataProvider
@@ -43,25 +44,19 @@ def _rebalance_dates(dates: List[pd.Timestamp], freq: str) -> List[pd.Timestamp]
     #   "daily"  : 모든 날짜 (매일 리밸런싱)
     #   "weekly" : ISO 주 번호가 바뀌는 첫 날 (주간 첫 거래일)
     #   "monthly": (연도, 월) 조합이 바뀌는 첫 날 (월간 첫 거래일)
-    # prev_marker를 이용해 기간 경계를 감지하고, 경계가 바뀔 때만 날짜를 선택한다.
+    # 날짜별 기간 키(marker)를 한 번에 계산하고, 직전 날짜와 키가 달라지는 날짜만 선택한다.
     if not dates:
         return []
-    if freq == "daily":
-        return dates
-    selected: List[pd.Timestamp] = []
-    prev_marker = None
-    for dt in dates:
-        marker: object
-        if freq == "weekly":
-            marker = dt.isocalendar().week
-        elif freq == "monthly":
-            marker = (dt.year, dt.month)
-        else:
-            marker = dt   # 알 수 없는 freq는 매일로 처리
-        if marker != prev_marker:
-            selected.append(dt)
-            prev_marker = marker
-    return selected
+    if freq not in ("weekly", "monthly"):
+        return dates   # "daily"와 알 수 없는 freq는 매일 리밸런싱
+    idx = pd.DatetimeIndex(dates)
+    if freq == "weekly":
+        iso = idx.isocalendar()
+        markers = iso["year"].to_numpy(dtype=np.int64) * 100 + iso["week"].to_numpy(dtype=np.int64)
+    else:
+        markers = idx.to_period("M").asi8
+    change = np.concatenate(([True], markers[1:] != markers[:-1]))
+    return [dates[i] for i in np.flatnonzero(change)]
 
 
 def _benchmark_curve(
@@ -83,15 +78,14 @@ def _benchmark_curve(
 
     # 진입 시 거래 비용을 초기 자산에서 차감
     total_bps = (fee_bps + slippage_bps) / 10_000
-    equity = initial_cash * (1 - total_bps)
-    curve: List[Dict[str, float]] = []
-    prev_price = None
-    for dt, price in series.items():
-        if prev_price is not None:
-            equity *= price / prev_price   # 전일 대비 수익률 적용
-        curve.append({"date": str(dt.date()), "equity": equity})
-        prev_price = price
-    return curve
+    prices = series.to_numpy(dtype=np.float64)
+    # [진입 자산, 1일차 가격비, 2일차 가격비, ...]의 누적곱 = 날짜별 자산 (루프와 곱셈 순서가 같다)
+    factors = np.empty(len(prices), dtype=np.float64)
+    factors[0] = initial_cash * (1 - total_bps)
+    factors[1:] = prices[1:] / prices[:-1]   # 전일 대비 수익률 적용
+    equity = np.cumprod(factors)
+    date_strs = pd.DatetimeIndex(series.index).strftime("%Y-%m-%d").tolist()
+    return [{"date": d, "equity": e} for d, e in zip(date_strs, equity.tolist())]
 
 
 def run(
@@ -169,7 +163,9 @@ def run(
 
     # universe 심볼 중 데이터가 없는 심볼은 조용히 제외하고 계속 진행한다.
     # 상장폐지·인수합병된 종목이 정적 유니버스에 섞여 있어도 백테스트가 죽지 않도록 한다.
-    missing = [s for s in universe if s not in prices_wide.columns or prices_wide[s].isna().all()]
+    # 컬럼별 isna().all()을 심볼마다 호출하지 않고, 값이 하나라도 있는 컬럼 집합을 한 번에 구한다.
+    available = frozenset(prices_wide.columns[prices_wide.notna().any().to_numpy()])
+    missing = [s for s in universe if s not in available]
     if missing:
         universe = [s for s in universe if s not in missing]
         if not universe:
@@ -297,84 +293,114 @@ def run(
 
     # --- 포트폴리오 시뮬레이션 ---
     # 신호를 날짜 → 비중 딕셔너리로 변환하여 O(1) 룩업을 가능하게 한다
-    signal_map: Dict[pd.Timestamp, Dict[str, float]] = {
-        pd.to_datetime(s.date): s.target_weights for s in signals
-    }
-
-    weights: Dict[str, float] = {}   # 현재 보유 비중 (비중 합 ≤ 1, 나머지는 현금)
-    equity = initial_cash
-    equity_curve: List[Dict[str, float]] = []
-    turnover_days: List[str] = []    # 비중 변경이 일어난 날짜 목록 (거래 통계 계산용)
-    holdings_history: List[Dict] = []
-    trade_log: List[Dict] = []
+    # 날짜 문자열은 신호마다 파싱하지 않고 한 번에 변환한다
+    # format="mixed": 첫 원소의 형식을 전체에 강제하지 않고 원소별로 해석한다 (기존 개별 파싱과 동일)
+    signal_dates = pd.to_datetime([s.date for s in signals], format="mixed")
+    signal_map: Dict[pd.Timestamp, Dict[str, float]] = dict(
+        zip(signal_dates, (s.target_weights for s in signals))
+    )
 
     total = len(dates)
-    stride = max(total // 50, 1)   # 진행률 콜백을 너무 자주 호출하지 않도록 보폭 설정
     if progress_cb and total:
         progress_cb("simulate", 0.0)
 
-    prev_prices = None
-    for idx, dt in enumerate(dates, start=1):
-        # 오늘이 리밸런싱 날짜이면 비중을 업데이트하고 거래 비용을 차감한다
-        if dt in signal_map:
-            new_weights = signal_map[dt]
-
-            # 턴오버 = 이전 비중과 새 비중의 절대 차이 합 (0~2 사이, 1이면 포트폴리오 전체 교체)
-            turnover = sum(
-                abs(new_weights.get(k, 0.0) - weights.get(k, 0.0))
-                for k in set(new_weights) | set(weights)
-            )
-
-            # 거래 비용 = 턴오버 × (수수료 + 슬리피지) / 10,000 (bps → 소수)
-            cost = turnover * (fee_bps + slippage_bps) / 10_000
-            equity *= 1 - cost
-            weights = new_weights
-            if turnover > 0:
-                turnover_days.append(str(dt.date()))
-
-            # 리밸런싱 매매 기록: 날짜, 비중(비중 내림차순 정렬), equity, 턴오버
-            sorted_weights = dict(
-                sorted(((k, v) for k, v in weights.items() if v > 0), key=lambda x: -x[1])
-            )
-            trade_log.append({
-                "date": str(dt.date()),
-                "equity": round(equity, 2),
-                "turnover_pct": round(turnover * 50, 1),  # 0~100% 단방향 기준
-                "n_positions": len(sorted_weights),
-                "weights": {k: round(v, 4) for k, v in sorted_weights.items()},
-            })
-
-        # 어제 대비 오늘의 자산 가치 변화를 계산한다
-        if prev_prices is not None:
-            daily_ret = 0.0
-            for symbol, w in weights.items():
-                if symbol not in price_matrix.columns:
-                    continue
-                prev_p = prev_prices.get(symbol)
-                curr_p = price_matrix.loc[dt].get(symbol)
-                # NaN이거나 데이터 없는 심볼은 수익률 0으로 처리 (포지션 동결)
-                # bool(float('nan')) == True 이므로 반드시 pd.notna()로 명시 체크한다
-                if prev_p and curr_p and pd.notna(prev_p) and pd.notna(curr_p):
-                    daily_ret += w * (curr_p / prev_p - 1)
-            equity *= 1 + daily_ret
-
-        equity_curve.append({"date": str(dt.date()), "equity": equity})
-        prev_prices = price_matrix.loc[dt].to_dict()
-
-        # 월말에 현재 보유 비중을 스냅샷으로 기록한다 (UI의 월별 보유 현황 표시에 사용)
-        if total:
-            is_last = idx == total
-            next_dt = dates[idx] if not is_last else None
-            is_month_end = is_last or (
-                next_dt is not None and next_dt.to_period("M") != dt.to_period("M")
-            )
-            if is_month_end:
-                snapshot = {k: v for k, v in weights.items() if v != 0}
-                holdings_history.append({"month": dt.strftime("%Y-%m"), "weights": snapshot})
-
-        # 시뮬레이션 진행률 콜백 (약 50번 호출)
-        if progress_cb and total and (idx % stride == 0 or idx == total):
-            progress_cb("simulate", idx / total)
+    # 시뮬레이션은 날짜×심볼 행렬 연산으로 한 번에 처리한다.
+    # 가격 행렬을 NumPy로 한 번만 꺼내고, 날짜 루프 대신 리밸런싱 횟수만큼만 Python 루프를 돈다.
+    P = price_matrix.to_numpy(dtype=np.float64, na_value=np.nan)
+    col_idx = {c: i for i, c in enumerate(price_matrix.columns)}
+
+    # 일간 수익률 행렬. NaN이거나 0인 가격은 수익률 0으로 처리한다 (포지션 동결).
+    rets = np.zeros_like(P)
+    if total > 1:
+        prev_p, curr_p = P[:-1], P[1:]
+        valid = ~np.isnan(prev_p) & ~np.isnan(curr_p) & (prev_p != 0) & (curr_p != 0)
+        np.divide(curr_p, prev_p, out=rets[1:], where=valid)
+        rets[1:][valid] -= 1.0
+
+    # 리밸런싱 날짜의 행 번호 (dates에 없는 신호 날짜는 무시)
+    row_of = {dt: i for i, dt in enumerate(dates)}
+    rebalances = sorted(
+        ((row_of[dt], w) for dt, w in signal_map.items() if dt in row_of),
+        key=lambda item: item[0],
+    )
+
+    # W[t] = t일 수익률에 적용되는 비중. 리밸런싱 당일 비중이 다음 리밸런싱 전날까지 유지된다.
+    # cost_factor[t] = t일 리밸런싱 거래 비용을 뺀 뒤 남는 자산 비율.
+    W = np.zeros_like(P)
+    cost_factor = np.ones(total, dtype=np.float64)
+    # 거래 비용 = 턴오버 × (수수료 + 슬리피지) / 10,000 (bps → 소수)
+    cost_per_turnover = (fee_bps + slippage_bps) / 10_000
+    turnovers: List[float] = []
+    w_vecs: List[np.ndarray] = []       # 리밸런싱별 비중 벡터 (price_matrix.columns 순서)
+    w_vec = np.zeros(len(col_idx), dtype=np.float64)   # 현재 보유 비중
+    for k, (row, new_weights) in enumerate(rebalances):
+        new_w_vec = np.zeros_like(w_vec)
+        for symbol, w in new_weights.items():
+            j = col_idx.get(symbol)
+            if j is not None:
+                new_w_vec[j] = w
+        # 턴오버 = 이전 비중과 새 비중의 절대 차이 합 (0~2 사이, 1이면 포트폴리오 전체 교체)
+        turnover = float(np.abs(new_w_vec - w_vec).sum())
+        cost_factor[row] = 1 - turnover * cost_per_turnover
+        end_row = rebalances[k + 1][0] if k + 1 < len(rebalances) else total
+        W[row:end_row] = new_w_vec
+        turnovers.append(turnover)
+        w_vecs.append(new_w_vec)
+        w_vec = new_w_vec
+
+    port_ret = np.einsum("ij,ij->i", W, rets)
+    equity_arr = initial_cash * np.cumprod(cost_factor * (1.0 + port_ret))
+    # 날짜 문자열과 월 키는 날짜마다 만들지 않고 한 번에 변환해 둔다
+    date_index = pd.DatetimeIndex(dates)
+    date_strs: List[str] = date_index.strftime("%Y-%m-%d").tolist()
+    equity_curve: List[Dict[str, float]] = [
+        {"date": d, "equity": e} for d, e in zip(date_strs, equity_arr.tolist())
+    ]
+
+    turnover_days: List[str] = []    # 비중 변경이 일어난 날짜 목록 (거래 통계 계산용)
+    trade_log: List[Dict] = []
+    for (row, new_weights), turnover in zip(rebalances, turnovers):
+        if turnover > 0:
+            turnover_days.append(date_strs[row])
+        # 리밸런싱 직후 equity = 전일 equity × (1 - 거래 비용)
+        equity = (equity_arr[row - 1] if row > 0 else initial_cash) * cost_factor[row]
+
+        # 리밸런싱 매매 기록: 날짜, 비중(비중 내림차순 정렬), equity, 턴오버
+        sorted_weights = dict(
+            sorted(((k, v) for k, v in new_weights.items() if v > 0), key=lambda x: -x[1])
+        )
+        trade_log.append({
+            "date": date_strs[row],
+            "equity": round(float(equity), 2),
+            "turnover_pct": round(turnover * 50, 1),  # 0~100% 단방향 기준
+            "n_positions": len(sorted_weights),
+            "weights": {k: round(v, 4) for k, v in sorted_weights.items()},
+        })
+
+    # 월말에 현재 보유 비중을 스냅샷으로 기록한다 (UI의 월별 보유 현황 표시에 사용)
+    # 월 키(Period 정수값)가 다음 날과 달라지는 행이 월말이다. 마지막 날은 항상 포함한다.
+    cols = list(price_matrix.columns)
+    month_keys = date_index.to_period("M").asi8
+    month_end_rows = (
+        np.flatnonzero(np.append(month_keys[1:] != month_keys[:-1], True))
+        if total else np.empty(0, dtype=np.intp)
+    )
+    # 각 월말 시점에 유효한 리밸런싱 = 그 날짜 이하의 마지막 리밸런싱
+    active = np.searchsorted([row for row, _ in rebalances], month_end_rows, side="right") - 1
+    empty_vec = np.zeros(len(cols), dtype=np.float64)
+    holdings_history: List[Dict] = [
+        {
+            "month": date_strs[row][:7],
+            "weights": {cols[j]: float(w_vec[j]) for j in np.flatnonzero(w_vec)},
+        }
+        for row, w_vec in zip(
+            month_end_rows.tolist(),
+            (w_vecs[k] if k >= 0 else empty_vec for k in active.tolist()),
+        )
+    ]
+
+    if progress_cb and total:
+        progress_cb("simulate", 1.0)
 
     # --- 성과 지표 계산 ---
     if progress_cb:
@@ -403,11 +429,9 @@ def run(
     # 평균 보유 기간: 연속된 리밸런싱 날짜 간격의 평균 (거래 빈도 파악에 사용)
     avg_hold_days = 0.0
     if len(turnover_days) > 1:
-        spans = [
-            (pd.to_datetime(turnover_days[i]) - pd.to_datetime(turnover_days[i - 1])).days
-            for i in range(1, len(turnover_days))
-        ]
-        avg_hold_days = sum(spans) / len(spans)
+        # ISO 날짜 문자열을 datetime64[D]로 한 번에 파싱하고 간격은 np.diff로 구한다
+        days = np.array(turnover_days, dtype="datetime64[D]")
+        avg_hold_days = float(np.diff(days).astype(np.int64).mean())
 
     return BacktestResult(
         metrics=compute_metrics(equity_curve, benchmark_curve=bench_curve),
@@ -0,0 +1,141 @@
+"""Parity checks for the vectorized ensemble backtest against the original dict implementation."""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from engine.backtest.ensemble import EnsembleStrategyContext, build_price_table, run_ensemble
+
+
+# --- dict reference implementation (the pre-vectorization engine) ---------------------------
+
+
+def _ref_momentum_weights(prices, dates, index, lookback, top_k) -> Dict[str, float]:
+    if index - lookback < 0:
+        return {}
+    returns = []
+    for ticker, series in prices.items():
+        start = series.get(dates[index - lookback])
+        end = series.get(dates[index])
+        if start and end:
+            returns.append((ticker, (end / start) - 1))
+    returns.sort(key=lambda x: x[1], reverse=True)
+    selected = [t for t, _ in returns[:top_k]]
+    if not selected:
+        return {}
+    weight = 1 / len(selected)
+    return {ticker: weight for ticker in selected}
+
+
+def _ref_normalize(weights: Dict[str, float]) -> Dict[str, float]:
+    total = sum(abs(w) for w in weights.values())
+    if total == 0:
+        return weights
+    return {k: v / total for k, v in weights.items()}
+
+
+def _ref_apply_constraints(weights: Dict[str, float], constraints: Dict[str, Any]) -> Dict[str, float]:
+    if constraints.get("max_weight_per_symbol") is not None:
+        max_w = constraints["max_weight_per_symbol"]
+        weights = {k: min(v, max_w) for k, v in weights.items()}
+    if constraints.get("min_trade_weight") is not None:
+        min_w = constraints["min_trade_weight"]
+        weights = {k: v for k, v in weights.items() if abs(v) >= min_w}
+    if constraints.get("max_positions") is not None:
+        max_pos = constraints["max_positions"]
+        sorted_items = sorted(weights.items(), key=lambda x: abs(x[1]), reverse=True)
+        weights = dict(sorted_items[:max_pos])
+    buffer_pct = constraints.get("cash_buffer_pct")
+    if constraints.get("normalize_weights", True):
+        weights = _ref_normalize(weights)
+        if buffer_pct is not None:
+            scale = max(0.0, 1 - buffer_pct)
+            weights = {k: v * scale for k, v in weights.items()}
+    elif buffer_pct is not None:
+        weights = {k: v * (1 - buffer_pct) for k, v in weights.items()}
+    return weights
+
+
+def _ref_run_ensemble(prices, dates, spec, strategies, ensemble) -> List[float]:
+    mix_w = ensemble.get("weights", {})
+    constraints = ensemble.get("constraints", {}) or {}
+    contexts = {ctx.strategy_id: ctx for ctx in strategies}
+    equity = spec.get("initial_cash", 1.0)
+    weights: Dict[str, float] = {}
+    curve: List[float] = []
+    steps = {"daily": 1, "weekly": 5, "monthly": 21}
+    for idx, date in enumerate(dates):
+        step = steps.get(spec["rebalance"])
+        if step is not None and idx % step == 0:
+            combined: Dict[str, float] = {}
+            for strat_id, ctx in contexts.items():
+                factor = mix_w.get(strat_id, 0.0)
+                lookback = int(ctx.params.get("lookback", 60))
+                top_k = int(ctx.params.get("top_k", 10))
+                for ticker, w in _ref_momentum_weights(prices, dates, idx, lookback, top_k).items():
+                    combined[ticker] = combined.get(ticker, 0.0) + factor * w
+            new_weights = _ref_normalize(_ref_apply_constraints(combined, constraints))
+            turnover = sum(
+                abs(new_weights.get(k, 0.0) - weights.get(k, 0.0)) for k in set(new_weights) | set(weights)
+            )
+            equity *= 1 - turnover * (spec["fee_bps"] + spec["slippage_bps"]) / 10000
+            weights = new_weights
+        daily_ret = 0.0
+        for ticker, w in weights.items():
+            series = prices.get(ticker, {})
+            prev_price = series.get(dates[idx - 1]) if idx > 0 else None
+            price = series.get(date)
+            if prev_price and price:
+                daily_ret += w * (price / prev_price - 1)
+        equity *= 1 + daily_ret
+        curve.append(equity)
+    return curve
+
+
+# --- tests --------------------------------------------------------------------------------------
+
+
+def _random_prices(seed: int, n_tickers: int = 12, n_days: int = 120):
+    rng = random.Random(seed)
+    dates = [f"2024-{1 + d // 28:02d}-{1 + d % 28:02d}" for d in range(n_days)]
+    prices: Dict[str, Dict[str, float]] = {}
+    for t in range(n_tickers):
+        price = 100.0
+        series: Dict[str, float] = {}
+        for date in dates:
+            # Coarse price steps so equal lookback returns (and hence mix-weight ties) are common
+            price = max(1.0, price + rng.choice([-2.0, -1.0, 0.0, 1.0, 2.0]))
+            if rng.random() > 0.03:
+                series[date] = price
+        prices[f"T{t:02d}"] = series
+    return prices, dates
+
+
+@pytest.mark.parametrize("seed", range(30))
+@pytest.mark.parametrize(
+    "constraints",
+    [
+        {"max_positions": 3},
+        {"max_positions": 5, "min_trade_weight": 0.05, "cash_buffer_pct": 0.1},
+        {"max_positions": 4, "max_weight_per_symbol": 0.2},
+    ],
+)
+def test_run_ensemble_matches_dict_reference(seed, constraints):
+    prices, dates = _random_prices(seed)
+    strategies = [
+        EnsembleStrategyContext("fast", {"lookback": 5, "top_k": 4}, "fast"),
+        EnsembleStrategyContext("slow", {"lookback": 20, "top_k": 4}, "slow"),
+    ]
+    spec = {"rebalance": "weekly", "fee_bps": 5.0, "slippage_bps": 2.0, "initial_cash": 1.0}
+    ensemble = {"weights": {"fast": 0.5, "slow": 0.5}, "constraints": constraints}
+
+    table = build_price_table(prices, dates)
+    result = run_ensemble(table, spec, strategies, ensemble)
+
+    expected = _ref_run_ensemble(prices, dates, spec, strategies, ensemble)
+    actual = [point["equity"] for point in result["equity_curve"]]
+    np.testing.assert_allclose(actual, expected, rtol=1e-12)